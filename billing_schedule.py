@@ -0,0 +1,183 @@
+"""
+Scout Financial - Billing Schedules
+Invoice schedules for accepted quotes, generated lazily.
+
+An accepted quote is billed weekly, monthly, quarterly or annually according
+to its payment terms, with the discounted weekly total converted the same way
+as the calculator's summary (4.33 weeks per month, 52 per year). Invoice
+lines are computed on demand: `schedule[period]` and `schedule.period_at(day)`
+are O(1), and the book-level streams never hold more than one pending line
+per client.
+
+Example:
+    schedule = BillingSchedule.from_quote('acme', quote, start=date(2026, 11, 1))
+    schedule[5]                         # sixth invoice
+    for line in stream_book(schedules, by_date=True): ...
+"""
+
+import calendar
+import heapq
+import itertools
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional
+
+from pricing import WEEKS_PER_MONTH, WEEKS_PER_YEAR
+
+# ============================================================================
+# BILLING TERMS
+# ============================================================================
+# Months per invoice (weekly billing is handled in days)
+BILLING_FREQUENCIES = {
+    'weekly': 0,
+    'monthly': 1,
+    'quarterly': 3,
+    'annual': 12
+}
+
+# Weekly totals converted to one full invoice
+WEEKS_PER_INVOICE = {
+    'weekly': 1,
+    'monthly': WEEKS_PER_MONTH,
+    'quarterly': WEEKS_PER_YEAR / 4,
+    'annual': WEEKS_PER_YEAR
+}
+
+PAYMENT_TERM_FREQUENCY = {
+    'Monthly': 'monthly',
+    'Quarterly (5% off)': 'quarterly',
+    'Annual (15% off)': 'annual',
+    'Multi-year (20% off)': 'annual'
+}
+
+CONTRACT_TERM_MONTHS = {
+    'Monthly': 12,
+    'Quarterly (5% off)': 12,
+    'Annual (15% off)': 12,
+    'Multi-year (20% off)': 36
+}
+
+def add_months(day: date, months: int) -> date:
+    """Same day `months` later, clamped to the end of shorter months."""
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    return date(year, month + 1, min(day.day, calendar.monthrange(year, month + 1)[1]))
+
+# ============================================================================
+# SCHEDULES
+# ============================================================================
+class InvoiceLine(NamedTuple):
+    client_id: str
+    period: int
+    period_start: date
+    period_end: date          # exclusive
+    amount: float
+
+class BillingSchedule:
+    """Invoice schedule for one accepted quote over its contract term."""
+
+    def __init__(self, client_id: str, weekly_total: float, frequency: str,
+                 start: date, term_months: int):
+        if frequency not in BILLING_FREQUENCIES:
+            raise ValueError(f"Unknown billing frequency: {frequency}")
+        self.client_id = client_id
+        self.weekly_total = weekly_total
+        self.frequency = frequency
+        self.start = start
+        self.term_months = term_months
+        self.end = add_months(start, term_months)
+
+        step = BILLING_FREQUENCIES[frequency]
+        if step:
+            self._periods = -(-term_months // step)
+        else:
+            self._periods = -(-(self.end - start).days // 7)
+        self._full_amount = weekly_total * WEEKS_PER_INVOICE[frequency]
+
+    @classmethod
+    def from_quote(cls, client_id: str, quote: Dict, start: date,
+                   term_months: Optional[int] = None, frequency: Optional[str] = None) -> 'BillingSchedule':
+        """Schedule for a calculator quote dict, billed per its payment terms."""
+        payment_term = quote['payment_term']
+        return cls(
+            client_id, quote['weekly_total'],
+            frequency or PAYMENT_TERM_FREQUENCY.get(payment_term, 'monthly'),
+            start, term_months or CONTRACT_TERM_MONTHS.get(payment_term, 12)
+        )
+
+    def __len__(self) -> int:
+        return self._periods
+
+    def _bounds(self, period: int):
+        step = BILLING_FREQUENCIES[self.frequency]
+        if step:
+            return add_months(self.start, period * step), min(add_months(self.start, (period + 1) * step), self.end)
+        return self.start + timedelta(weeks=period), min(self.start + timedelta(weeks=period + 1), self.end)
+
+    def __getitem__(self, period: int) -> InvoiceLine:
+        if period < 0:
+            period += self._periods
+        if not 0 <= period < self._periods:
+            raise IndexError(period)
+        period_start, period_end = self._bounds(period)
+
+        # A final short period is prorated
+        step = BILLING_FREQUENCIES[self.frequency]
+        if step:
+            months = min(step, self.term_months - period * step)
+            fraction = months / step
+        else:
+            fraction = (period_end - period_start).days / 7
+        return InvoiceLine(self.client_id, period, period_start, period_end, round(self._full_amount * fraction, 2))
+
+    def period_at(self, day: date) -> int:
+        """Index of the billing period containing `day`."""
+        if not self.start <= day < self.end:
+            raise ValueError(f"{day} is outside the contract term")
+        step = BILLING_FREQUENCIES[self.frequency]
+        if not step:
+            return (day - self.start).days // 7
+        months = (day.year - self.start.year) * 12 + day.month - self.start.month
+        period = months // step
+        # Month arithmetic can overshoot by one when `day` is early in its month
+        if day < self._bounds(period)[0]:
+            period -= 1
+        return period
+
+    def lines(self, start_period: int = 0) -> Iterator[InvoiceLine]:
+        """Yield invoice lines lazily, starting at `start_period`."""
+        for period in range(start_period, self._periods):
+            yield self[period]
+
+    def __iter__(self) -> Iterator[InvoiceLine]:
+        return self.lines()
+
+    def lines_from(self, day: date) -> Iterator[InvoiceLine]:
+        """Yield invoice lines from the period containing `day` onward."""
+        return self.lines(self.period_at(max(day, self.start)) if day < self.end else self._periods)
+
+# ============================================================================
+# BOOK STREAMS
+# ============================================================================
+def stream_book(schedules: Iterable[BillingSchedule], by_date: bool = False,
+                since: Optional[date] = None) -> Iterator[InvoiceLine]:
+    """Stream invoice lines for many clients.
+
+    By default lines come client by client; with `by_date` they are merged
+    into billing-date order, holding one pending line per client. `since`
+    seeks every schedule straight to the period containing that day.
+    """
+    streams = (schedule.lines_from(since) if since else schedule.lines() for schedule in schedules)
+    if by_date:
+        return heapq.merge(*streams, key=lambda line: (line.period_start, line.client_id))
+    return itertools.chain.from_iterable(streams)
+
+def invoices_due(schedules: Iterable[BillingSchedule], period_start: date, period_end: date) -> Iterator[InvoiceLine]:
+    """Invoice lines whose period starts in [period_start, period_end)."""
+    for schedule in schedules:
+        if schedule.end <= period_start or schedule.start >= period_end:
+            continue
+        for line in schedule.lines_from(period_start):
+            if line.period_start >= period_end:
+                break
+            if line.period_start >= period_start:
+                yield line
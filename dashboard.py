@@ -0,0 +1,96 @@
+"""
+Scout Financial - Quote Analytics Dashboard
+Internal Streamlit page over the pre-aggregated quote rollups.
+
+To run locally:
+1. streamlit run dashboard.py
+
+Queries read the rollup tables only, so page loads cost O(groups) no matter
+how many quotes have been generated.
+"""
+
+import streamlit as st
+
+from pricing import PRICING, format_currency
+from quote_archive import QuoteArchive
+from quote_rollups import DIMENSIONS, EVENTS, QuoteRollups
+
+st.set_page_config(
+    page_title="Scout Financial - Quote Analytics",
+    page_icon="🦉",
+    layout="wide"
+)
+
+@st.cache_resource
+def get_quote_rollups() -> QuoteRollups:
+    """Shared dashboard rollups (one per server process)."""
+    return QuoteRollups()
+
+DIMENSION_LABELS = {
+    'industry': 'Industry',
+    'entity_type': 'Entity Type',
+    'employee_band': 'Employee Band',
+    'payment_term': 'Payment Term'
+}
+
+rollups = get_quote_rollups()
+
+st.markdown("## 📊 Quote Analytics")
+
+col1, col2 = st.columns([1, 2])
+with col1:
+    event = st.selectbox("Quotes", EVENTS, format_func=str.capitalize)
+with col2:
+    by = st.multiselect("Group by", DIMENSIONS, default=['industry'], format_func=DIMENSION_LABELS.get)
+
+# ============================================================================
+# QUOTE COUNTS & AVERAGE WEEKLY TOTAL
+# ============================================================================
+st.markdown("### Quotes")
+summary = rollups.summary(by, event)
+st.dataframe([
+    {**{DIMENSION_LABELS[d]: row[d] for d in by},
+     'Quotes': row['quotes'],
+     'Avg Weekly Total': format_currency(row['avg_weekly_total'] or 0)}
+    for row in summary
+], use_container_width=True)
+
+# ============================================================================
+# TIER MIX
+# ============================================================================
+st.markdown("### Tier Mix")
+tier_mix = {}
+for row in rollups.tier_mix(by, event):
+    key = tuple(row[d] for d in by) + (PRICING[row['service']]['name'],)
+    counts = tier_mix.setdefault(key, {'Not selected': 0, 'Tier 1': 0, 'Tier 2': 0, 'Tier 3': 0})
+    counts['Not selected' if row['tier'] == 0 else f"Tier {row['tier']}"] += row['quotes']
+st.dataframe([
+    {**{DIMENSION_LABELS[d]: value for d, value in zip(by, key)}, 'Service': key[-1], **counts}
+    for key, counts in tier_mix.items()
+], use_container_width=True)
+
+# ============================================================================
+# DISCOUNT DISTRIBUTION
+# ============================================================================
+st.markdown("### Discounts")
+component = st.selectbox("Component", ['total', 'bundle', 'volume', 'payment'], format_func=str.capitalize)
+st.dataframe([
+    {**{DIMENSION_LABELS[d]: row[d] for d in by}, 'Discount': f"{row['rate_pct']}%", 'Quotes': row['quotes']}
+    for row in rollups.discount_mix(by, event)
+    if row['component'] == component
+], use_container_width=True)
+
+# ============================================================================
+# MAINTENANCE
+# ============================================================================
+with st.expander("Maintenance"):
+    if st.button("Verify rollups against the quote archive"):
+        mismatches = rollups.verify(QuoteArchive())
+        if mismatches:
+            st.error(f"{len(mismatches)} rollup rows differ from a rebuild")
+            st.code('\n'.join(mismatches[:50]))
+        else:
+            st.success("Rollups match a rebuild from the archive.")
+    if st.button("Rebuild rollups from the quote archive"):
+        rollups.rebuild(QuoteArchive())
+        st.success("Rollups rebuilt.")
@@ -0,0 +1,135 @@
+"""
+Scout Financial - Recurring Revenue Forecast
+Monte Carlo MRR/ARR forecast over the client book. Each trial draws monthly
+headcount and expense growth for every client and reprices the book month by
+month, so clients move across the bookkeeping expense bands, the HR/payroll
+per-employee charges and the volume-discount bands as they grow.
+
+Example:
+    book = ClientBook(employees, monthly_expenses, tiers, payment_term)
+    result = forecast_revenue(book, months=12, trials=10000, seed=42)
+    result.mrr   # (len(percentiles), months) percentile bands
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pricing import (
+    BOOKKEEPING_EXPENSE_BANDS, SERVICE_KEYS, WEEKS_PER_MONTH, WEEKS_PER_YEAR,
+    ClientBook, bookkeeping_band, calculate_discounts_array, calculate_weekly_prices
+)
+
+# Trials per worker task. Fixed so results do not depend on the worker count.
+TRIALS_PER_CHUNK = 50
+
+# ============================================================================
+# ASSUMPTIONS & RESULTS
+# ============================================================================
+@dataclass
+class GrowthAssumptions:
+    """Monthly log-normal growth of client headcount and expenses."""
+    headcount_drift: float = 0.01
+    headcount_volatility: float = 0.05
+    expense_drift: float = 0.01
+    expense_volatility: float = 0.06
+
+@dataclass
+class ForecastResult:
+    """Percentile revenue bands, one row per percentile and one column per month."""
+    percentiles: Tuple[float, ...]
+    mrr: np.ndarray
+    arr: np.ndarray
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+def _price_components(book: ClientBook):
+    """Split each client's subtotal into a flat part, a per-employee part and
+    a bookkeeping price per expense band, all priced by the vectorized engine.
+
+    Every service except bookkeeping is linear in headcount and independent of
+    expenses, and bookkeeping depends only on the expense band, so a month can
+    be repriced from these components without re-running the full engine.
+    """
+    n = len(book)
+    bookkeeping_col = SERVICE_KEYS.index('bookkeeping')
+
+    other_tiers = book.tiers.copy()
+    other_tiers[:, bookkeeping_col] = 0
+    flat = calculate_weekly_prices(other_tiers, np.zeros(n), book.monthly_expenses).sum(axis=1)
+    per_employee = calculate_weekly_prices(other_tiers, np.ones(n), book.monthly_expenses).sum(axis=1) - flat
+
+    bookkeeping_tiers = np.zeros_like(book.tiers)
+    bookkeeping_tiers[:, bookkeeping_col] = book.tiers[:, bookkeeping_col]
+    probes = list(BOOKKEEPING_EXPENSE_BANDS) + [BOOKKEEPING_EXPENSE_BANDS[-1] + 1]
+    by_band = np.column_stack([
+        calculate_weekly_prices(bookkeeping_tiers, np.zeros(n), np.full(n, probe))[:, bookkeeping_col]
+        for probe in probes
+    ])
+
+    return flat, per_employee, by_band
+
+def _simulate_chunk(task) -> np.ndarray:
+    """Run one chunk of trials; returns the book's weekly total per (trial, month)."""
+    (seed, trials, months, growth, employees, monthly_expenses,
+     service_count, payment_term, flat, per_employee, by_band) = task
+    rng = np.random.default_rng(seed)
+    n = len(employees)
+    clients = np.arange(n)
+
+    # Growth is accumulated as a log factor so a client that has not grown
+    # keeps its exact headcount and expenses (and stays on its band edge).
+    log_growth_employees = np.zeros((trials, n))
+    log_growth_expenses = np.zeros((trials, n))
+    weekly = np.empty((trials, months))
+
+    for month in range(months):
+        log_growth_employees += rng.normal(growth.headcount_drift, growth.headcount_volatility, (trials, n))
+        log_growth_expenses += rng.normal(growth.expense_drift, growth.expense_volatility, (trials, n))
+
+        headcount = np.maximum(np.rint(employees * np.exp(log_growth_employees)), 1)
+        expenses = monthly_expenses * np.exp(log_growth_expenses)
+
+        subtotal = flat + per_employee * headcount + by_band[clients, bookkeeping_band(expenses)]
+        discount = calculate_discounts_array(service_count, headcount, payment_term)['total']
+        weekly[:, month] = (subtotal * (1 - discount)).sum(axis=1)
+
+    return weekly
+
+def forecast_revenue(book: ClientBook, months: int = 12, trials: int = 10000, seed: int = 0,
+                     growth: Optional[GrowthAssumptions] = None,
+                     percentiles: Tuple[float, ...] = (5, 25, 50, 75, 95),
+                     workers: Optional[int] = None) -> ForecastResult:
+    """Simulate book revenue and return MRR/ARR percentile bands per month.
+
+    Trials are split into fixed-size chunks with independent seeds spawned
+    from `seed`, so the result is reproducible for any number of workers.
+    """
+    growth = growth or GrowthAssumptions()
+    workers = workers or os.cpu_count() or 1
+
+    flat, per_employee, by_band = _price_components(book)
+    chunk_sizes = [min(TRIALS_PER_CHUNK, trials - start) for start in range(0, trials, TRIALS_PER_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    tasks = [
+        (chunk_seed, size, months, growth, book.employees, book.monthly_expenses,
+         book.service_count, book.payment_term, flat, per_employee, by_band)
+        for chunk_seed, size in zip(seeds, chunk_sizes)
+    ]
+
+    if workers == 1:
+        weekly = np.vstack([_simulate_chunk(task) for task in tasks])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            weekly = np.vstack(list(executor.map(_simulate_chunk, tasks)))
+
+    bands = np.percentile(weekly, percentiles, axis=0)
+    return ForecastResult(
+        percentiles=tuple(percentiles),
+        mrr=bands * WEEKS_PER_MONTH,
+        arr=bands * WEEKS_PER_YEAR
+    )
@@ -0,0 +1,186 @@
+"""
+Scout Financial - Group Pricing
+Consolidated quotes for holding groups with many subsidiaries.
+
+Every entity keeps its own headcount, expenses, tax complexity and service
+tiers, and all entities are priced in one batched pass. Bundle and volume
+discounts are negotiated at group level: the bundle counts distinct services
+used anywhere in the group and the volume band uses the group's total
+headcount. The group discount (still capped at 40%) applies to every entity,
+and totals are rolled up through the ownership hierarchy.
+"""
+
+import csv
+import io
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, TextIO
+
+import numpy as np
+
+from pricing import SERVICE_KEYS, calculate_discounts, calculate_weekly_prices, get_auto_tax_tiers
+
+# ============================================================================
+# GROUP DATA
+# ============================================================================
+@dataclass
+class GroupEntity:
+    """One company in a group; `parent` names its owner (None for the top)."""
+    name: str
+    parent: Optional[str]
+    employees: int
+    monthly_expenses: int
+    tiers: Dict[str, int]
+    states: int = 1
+    entity_type: str = 'LLC'
+    monthly_revenue: int = 0
+    is_profitable: bool = False
+    has_1099s: bool = False
+    num_1099s: int = 0
+
+@dataclass
+class GroupQuote:
+    """Priced group; per-entity arrays follow the order of `names`."""
+    names: List[str]
+    parents: np.ndarray                 # index of the parent entity, -1 at the top
+    tiers: np.ndarray                   # effective tiers (tax raised to its minimum)
+    weekly_prices: np.ndarray           # (entities, services)
+    entity_subtotal: np.ndarray
+    entity_total: np.ndarray
+    rollup_subtotal: np.ndarray         # entity plus everything it owns
+    rollup_total: np.ndarray
+    employees: int
+    service_count: int
+    payment_term: str
+    discounts: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def weekly_subtotal(self) -> float:
+        return float(self.entity_subtotal.sum())
+
+    @property
+    def weekly_total(self) -> float:
+        return float(self.entity_total.sum())
+
+# ============================================================================
+# PRICING
+# ============================================================================
+def _hierarchy_depths(parents: np.ndarray) -> np.ndarray:
+    """Depth of every entity below the top of the group; rejects cycles."""
+    depths = np.zeros(len(parents), dtype=np.int64)
+    ancestor = parents.copy()
+    for _ in range(len(parents)):
+        below = ancestor >= 0
+        if not below.any():
+            return depths
+        depths += below
+        ancestor = np.where(below, parents[np.maximum(ancestor, 0)], -1)
+    raise ValueError("Group ownership hierarchy contains a cycle")
+
+def _roll_up(values: np.ndarray, parents: np.ndarray, depths: np.ndarray) -> np.ndarray:
+    """Add each entity's value into all of its owners, deepest level first."""
+    totals = values.astype(float)
+    for depth in range(int(depths.max(initial=0)), 0, -1):
+        level = np.flatnonzero(depths == depth)
+        np.add.at(totals, parents[level], totals[level])
+    return totals
+
+def quote_group(entities: List[GroupEntity], payment_term: str) -> GroupQuote:
+    """Price every entity and apply group-level discounts."""
+    if not entities:
+        raise ValueError("Group has no entities")
+    for entity in entities:
+        if entity.employees < 1:
+            raise ValueError(f"{entity.name}: employees must be at least 1, got {entity.employees}")
+        if entity.monthly_expenses < 0:
+            raise ValueError(f"{entity.name}: monthly expenses can't be negative, got {entity.monthly_expenses}")
+        unknown_services = set(entity.tiers) - set(SERVICE_KEYS)
+        if unknown_services:
+            raise ValueError(f"{entity.name}: unknown services {sorted(unknown_services)}")
+        invalid = {service: tier for service, tier in entity.tiers.items() if tier not in (0, 1, 2, 3)}
+        if invalid:
+            raise ValueError(f"{entity.name}: service tiers must be 0-3, got {invalid}")
+    names = [entity.name for entity in entities]
+    index = {name: i for i, name in enumerate(names)}
+    if len(index) != len(names):
+        raise ValueError("Entity names must be unique within a group")
+    unknown = {e.parent for e in entities if e.parent is not None and e.parent not in index}
+    if unknown:
+        raise ValueError(f"Unknown parent entities: {sorted(unknown)}")
+    parents = np.array([index[e.parent] if e.parent is not None else -1 for e in entities], dtype=np.int64)
+
+    employees = np.array([e.employees for e in entities])
+    monthly_expenses = np.array([e.monthly_expenses for e in entities])
+    tiers = np.array([[e.tiers.get(service, 0) for service in SERVICE_KEYS] for e in entities],
+                     dtype=np.int64).reshape(len(entities), len(SERVICE_KEYS))
+
+    # Tax tier can't go below each entity's own complexity minimum
+    tax = SERVICE_KEYS.index('tax')
+    auto_tax_tiers = get_auto_tax_tiers(
+        [e.states for e in entities], [e.is_profitable for e in entities],
+        [e.monthly_revenue for e in entities], [e.has_1099s for e in entities],
+        [e.num_1099s for e in entities], [e.entity_type for e in entities]
+    )
+    tiers[:, tax] = np.where(tiers[:, tax] > 0, np.maximum(tiers[:, tax], auto_tax_tiers), 0)
+
+    weekly_prices = calculate_weekly_prices(tiers, employees, monthly_expenses)
+    entity_subtotal = weekly_prices.sum(axis=1)
+
+    group_employees = int(employees.sum())
+    service_count = int(np.count_nonzero(tiers.any(axis=0)))
+    discounts = calculate_discounts(service_count, group_employees, payment_term)
+    entity_total = entity_subtotal * (1 - discounts['total'])
+
+    depths = _hierarchy_depths(parents)
+    return GroupQuote(
+        names=names,
+        parents=parents,
+        tiers=tiers,
+        weekly_prices=weekly_prices,
+        entity_subtotal=entity_subtotal,
+        entity_total=entity_total,
+        rollup_subtotal=_roll_up(entity_subtotal, parents, depths),
+        rollup_total=_roll_up(entity_total, parents, depths),
+        employees=group_employees,
+        service_count=service_count,
+        payment_term=payment_term,
+        discounts=discounts
+    )
+
+# ============================================================================
+# CSV IMPORT
+# ============================================================================
+CSV_COLUMNS = ('name', 'parent', 'employees', 'monthly_expenses', 'states', 'entity_type',
+               'monthly_revenue', 'is_profitable', 'has_1099s', 'num_1099s') + SERVICE_KEYS
+
+def _flag(value: str) -> bool:
+    return value.strip().lower() in ('1', 'true', 'yes', 'y')
+
+def read_group_csv(source: TextIO) -> List[GroupEntity]:
+    """Read entities from CSV with CSV_COLUMNS headers; service columns hold
+    the tier (1-3), blank or 0 when the entity doesn't take the service."""
+    entities = []
+    for row in csv.DictReader(source):
+        row = {key.strip(): (value or '').strip() for key, value in row.items() if key}
+        entities.append(GroupEntity(
+            name=row['name'],
+            parent=row.get('parent') or None,
+            employees=int(row['employees']),
+            monthly_expenses=int(row['monthly_expenses']),
+            tiers={service: int(row[service]) for service in SERVICE_KEYS if row.get(service, '') not in ('', '0')},
+            states=int(row.get('states') or 1),
+            entity_type=row.get('entity_type') or 'LLC',
+            monthly_revenue=int(row.get('monthly_revenue') or 0),
+            is_profitable=_flag(row.get('is_profitable', '')),
+            has_1099s=_flag(row.get('has_1099s', '')),
+            num_1099s=int(row.get('num_1099s') or 0)
+        ))
+    return entities
+
+def group_csv_template() -> str:
+    """Header row plus an example parent/subsidiary pair."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(CSV_COLUMNS)
+    writer.writerow(['Acme Holdings', '', 5, 20000, 1, 'C-Corporation', 0, 'no', 'no', 0, 2, '', '', 3, 2, ''])
+    writer.writerow(['Acme West LLC', 'Acme Holdings', 40, 80000, 2, 'LLC', 150000, 'yes', 'yes', 4, 1, 2, 2, 1, '', ''])
+    return out.getvalue()
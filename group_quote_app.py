@@ -0,0 +1,77 @@
+"""
+Scout Financial - Group Quote
+Internal Streamlit page for consolidated quotes on multi-entity client groups.
+
+To run locally:
+1. streamlit run group_quote_app.py
+
+Upload one CSV row per entity (see the template); all entities are priced
+together and group-level bundle/volume discounts are applied to the group.
+"""
+
+import io
+
+import streamlit as st
+
+from group_pricing import group_csv_template, quote_group, read_group_csv
+from pricing import PAYMENT_TERMS, PRICING, SERVICE_KEYS, WEEKS_PER_YEAR, format_currency, format_percent
+
+st.set_page_config(
+    page_title="Scout Financial - Group Quote",
+    page_icon="🦉",
+    layout="wide"
+)
+
+st.markdown("## 🏢 Group Quote")
+st.download_button("Download CSV template", group_csv_template(), file_name="group_quote_template.csv")
+
+uploaded = st.file_uploader("Entities CSV", type="csv")
+payment_term = st.selectbox("Payment Terms", PAYMENT_TERMS)
+
+if uploaded is not None:
+    try:
+        group = quote_group(read_group_csv(io.StringIO(uploaded.getvalue().decode('utf-8'))), payment_term)
+    except (KeyError, ValueError) as error:
+        st.error(f"Could not read group: {error}")
+        st.stop()
+
+    # ========================================================================
+    # GROUP SUMMARY
+    # ========================================================================
+    discounts = group.discounts
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Entities", len(group.names))
+    col2.metric("Employees", f"{group.employees:,}")
+    col3.metric("Weekly Total", format_currency(group.weekly_total))
+    col4.metric("Discount", format_percent(discounts['total']))
+    st.markdown(
+        f"Bundle ({group.service_count} services): **-{format_percent(discounts['bundle'])}** · "
+        f"Volume ({group.employees:,} employees): **-{format_percent(discounts['volume'])}** · "
+        f"Payment term: **-{format_percent(discounts['payment'])}**"
+    )
+
+    # ========================================================================
+    # HIERARCHY & ENTITIES
+    # ========================================================================
+    st.markdown("### Ownership Rollup")
+    st.dataframe([
+        {
+            'Entity': name,
+            'Parent': group.names[parent] if parent >= 0 else '',
+            'Own Weekly': format_currency(group.entity_total[i]),
+            'Incl. Subsidiaries Weekly': format_currency(group.rollup_total[i]),
+            'Incl. Subsidiaries Annual': format_currency(group.rollup_total[i] * WEEKS_PER_YEAR)
+        }
+        for i, (name, parent) in enumerate(zip(group.names, group.parents))
+    ], use_container_width=True)
+
+    st.markdown("### Entity Pricing (before group discount)")
+    st.dataframe([
+        {
+            'Entity': name,
+            **{PRICING[service]['name']: format_currency(group.weekly_prices[i, col])
+               if group.tiers[i, col] else '' for col, service in enumerate(SERVICE_KEYS)},
+            'Subtotal': format_currency(group.entity_subtotal[i])
+        }
+        for i, name in enumerate(group.names)
+    ], use_container_width=True)
@@ -0,0 +1,190 @@
+"""
+Scout Financial - Discount Policy Simulator
+Replays candidate discount policies against the stored quote corpus.
+
+Every archived quote keeps its services, headcount, payment term and
+undiscounted subtotal, so a candidate policy (bundle bands, volume bands,
+payment-term rates and cap) only has to recompute the discount.
+
+The archive holds one row per distinct draft a prospect looked at in step 3
+(every tier or service toggle adds a row) plus one `submitted` row per quote
+request. Replaying drafts weights prospects by how much they clicked around,
+so by default only submitted quotes are replayed. All
+candidates are evaluated in one pass over the memory-mapped archive, split
+into row ranges across worker processes.
+
+Example:
+    candidates = [DiscountPolicy(cap=0.35, name='cap 35%'), ...]
+    for result in simulate_policies(QuoteArchive(), candidates, segments=('industry',)):
+        print(result.name, result.annual_revenue_delta, result.cap_bind_rate)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from pricing import PAYMENT_TERMS, SERVICE_KEYS, WEEKS_PER_YEAR, DiscountPolicy, calculate_discounts_array
+from quote_archive import QuoteArchive
+from quote_rollups import DIMENSIONS, EMPLOYEE_BANDS, employee_band_index
+
+# Rows per worker task; each task streams its range in memmap chunks
+ROWS_PER_TASK = 1 << 21
+
+# Price changes smaller than half a cent are not counted as wins or losses
+_EPSILON = 0.005
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+@dataclass
+class PolicyResult:
+    """Outcome of one candidate policy over the corpus (weekly amounts)."""
+    name: str
+    quotes: int
+    baseline_revenue: float
+    revenue: float
+    cap_binds: int
+    segments: List[Dict]
+
+    @property
+    def revenue_delta(self) -> float:
+        return self.revenue - self.baseline_revenue
+
+    @property
+    def annual_revenue_delta(self) -> float:
+        return self.revenue_delta * WEEKS_PER_YEAR
+
+    @property
+    def cap_bind_rate(self) -> float:
+        return self.cap_binds / self.quotes if self.quotes else 0.0
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+def _segment_labels(dictionaries: Dict[str, List[str]], segments: Sequence[str]) -> Dict[str, List[str]]:
+    return {name: list(EMPLOYEE_BANDS) if name == 'employee_band' else list(dictionaries[name])
+            for name in segments}
+
+def _replay_range(task) -> Dict[str, np.ndarray]:
+    """Replay every policy over one row range of the archive."""
+    path, start, stop, dictionaries, policies, segments, submitted_only, chunk_rows = task
+    archive = QuoteArchive(path)
+    labels = _segment_labels(dictionaries, segments)
+    groups = int(np.prod([len(labels[name]) for name in segments]))
+
+    # Archive payment-term codes -> index into PAYMENT_TERMS
+    payment_labels = dictionaries['payment_term']
+    unknown = set(payment_labels) - set(PAYMENT_TERMS)
+    if unknown:
+        raise ValueError(f"Unknown payment terms in archive: {sorted(unknown)}")
+    payment_index = np.array([PAYMENT_TERMS.index(label) for label in payment_labels], dtype=np.int64)
+
+    names = ['submitted', 'employees', 'payment_term', 'weekly_subtotal', 'weekly_total']
+    names += [f'tier_{service}' for service in SERVICE_KEYS]
+    names += [name for name in segments if name not in names and name != 'employee_band']
+    columns = {name: archive.column(name, stop)[start:stop] for name in names}
+
+    totals = {
+        'quotes': np.zeros(groups),
+        'baseline': np.zeros(groups),
+        'revenue': np.zeros((len(policies), groups)),
+        'winners': np.zeros((len(policies), groups)),
+        'losers': np.zeros((len(policies), groups)),
+        'cap_binds': np.zeros((len(policies), groups)),
+    }
+    for offset in range(0, stop - start, chunk_rows):
+        chunk = {name: values[offset:offset + chunk_rows] for name, values in columns.items()}
+        keep = chunk['submitted'] if submitted_only else slice(None)
+        employees = np.asarray(chunk['employees'][keep])
+        subtotal = np.asarray(chunk['weekly_subtotal'][keep])
+        baseline = np.asarray(chunk['weekly_total'][keep])
+        payment_term = payment_index[chunk['payment_term'][keep]]
+        service_count = sum((chunk[f'tier_{service}'][keep] > 0).astype(np.int64) for service in SERVICE_KEYS)
+
+        segment = np.zeros(len(subtotal), dtype=np.int64)
+        for name in segments:
+            codes = employee_band_index(employees) if name == 'employee_band' else chunk[name][keep]
+            segment = segment * len(labels[name]) + codes
+
+        totals['quotes'] += np.bincount(segment, minlength=groups)
+        totals['baseline'] += np.bincount(segment, weights=baseline, minlength=groups)
+        for i, policy in enumerate(policies):
+            discounts = calculate_discounts_array(service_count, employees, payment_term, policy)
+            revenue = subtotal * (1 - discounts['total'])
+            delta = revenue - baseline
+            uncapped = discounts['bundle'] + discounts['volume'] + discounts['payment']
+            totals['revenue'][i] += np.bincount(segment, weights=revenue, minlength=groups)
+            totals['winners'][i] += np.bincount(segment, weights=delta < -_EPSILON, minlength=groups)
+            totals['losers'][i] += np.bincount(segment, weights=delta > _EPSILON, minlength=groups)
+            totals['cap_binds'][i] += np.bincount(segment, weights=uncapped > policy.cap, minlength=groups)
+    return totals
+
+def simulate_policies(archive: QuoteArchive, policies: Sequence[DiscountPolicy],
+                      segments: Sequence[str] = ('industry',), submitted_only: bool = True,
+                      workers: Optional[int] = None, chunk_rows: int = 1 << 18) -> List[PolicyResult]:
+    """Evaluate candidate policies against every archived quote.
+
+    Per segment, "winners" are quotes that would cost the client less under
+    the candidate and "losers" quotes that would cost more. Pass
+    `submitted_only=False` to include every draft shown in the calculator.
+    """
+    unknown = set(segments) - set(DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown segments: {sorted(unknown)}")
+    segments = tuple(segments)
+    policies = list(policies)
+    workers = workers or os.cpu_count() or 1
+
+    # One snapshot for every worker, so quotes appended meanwhile are ignored
+    rows, dictionaries = archive.snapshot()
+    tasks = [(archive.path, start, min(start + ROWS_PER_TASK, rows), dictionaries, policies, segments,
+              submitted_only, chunk_rows)
+             for start in range(0, rows, ROWS_PER_TASK)]
+    if workers == 1 or len(tasks) <= 1:
+        partials = [_replay_range(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(_replay_range, tasks))
+
+    labels = _segment_labels(dictionaries, segments)
+    groups = int(np.prod([len(labels[name]) for name in segments]))
+    totals = {key: sum(partial[key] for partial in partials) for key in partials[0]} if partials else None
+
+    segment_labels = []
+    for key in range(groups):
+        parts = {}
+        for name in reversed(segments):
+            key, code = divmod(key, len(labels[name]))
+            parts[name] = labels[name][code]
+        segment_labels.append({name: parts[name] for name in segments})
+
+    results = []
+    for i, policy in enumerate(policies):
+        if totals is None:
+            results.append(PolicyResult(policy.name, 0, 0.0, 0.0, 0, []))
+            continue
+        segment_rows = [
+            {
+                **segment_labels[g],
+                'quotes': int(totals['quotes'][g]),
+                'baseline_revenue': float(totals['baseline'][g]),
+                'revenue': float(totals['revenue'][i, g]),
+                'revenue_delta': float(totals['revenue'][i, g] - totals['baseline'][g]),
+                'winners': int(totals['winners'][i, g]),
+                'losers': int(totals['losers'][i, g]),
+                'cap_binds': int(totals['cap_binds'][i, g]),
+            }
+            for g in np.flatnonzero(totals['quotes'])
+        ]
+        results.append(PolicyResult(
+            name=policy.name,
+            quotes=int(totals['quotes'].sum()),
+            baseline_revenue=float(totals['baseline'].sum()),
+            revenue=float(totals['revenue'][i].sum()),
+            cap_binds=int(totals['cap_binds'][i].sum()),
+            segments=sorted(segment_rows, key=lambda row: row['revenue_delta'])
+        ))
+    return results
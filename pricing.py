@@ -0,0 +1,455 @@
+"""
+Scout Financial - Pricing Engine
+Pricing data and price/discount calculations shared by the calculator app
+and the analytics tooling. Importing this module does not start Streamlit.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# ============================================================================
+# PRICING DATA
+# ============================================================================
+PRICING = {
+    'bookkeeping': {
+        'name': 'Bookkeeping',
+        'icon': '📊',
+        'description': 'Transaction categorization, reconciliation, financial statements, and reporting',
+        'tiers': {
+            1: {
+                'name': 'Foundation',
+                'response_time': '5 business days',
+                'description': 'Standard monthly close, basic reporting',
+                'features': ['Monthly reconciliation', 'Standard financial statements', 'Email support', 'Reports by 10th business day'],
+                'get_price': lambda exp: 845 if exp <= 30000 else 1278 if exp <= 60000 else 1712 if exp <= 100000 else 2145 if exp <= 150000 else 2578 if exp <= 200000 else 3000
+            },
+            2: {
+                'name': 'Growth',
+                'response_time': '3 business days',
+                'description': 'Accelerated close, enhanced reporting',
+                'features': ['Weekly reconciliation', 'Custom financial reports', 'Priority email + phone', 'Reports by 6th business day', 'Cash flow analysis'],
+                'get_price': lambda exp: 1100 if exp <= 30000 else 1662 if exp <= 60000 else 2226 if exp <= 100000 else 2789 if exp <= 150000 else 3352 if exp <= 200000 else 3900
+            },
+            3: {
+                'name': 'Performance',
+                'response_time': 'Same day',
+                'description': 'Real-time support, controller-level insights',
+                'features': ['Real-time reconciliation', 'Executive dashboards', 'Dedicated accountant', 'Same-day response', 'Strategic insights'],
+                'get_price': lambda exp: 1430 if exp <= 30000 else 2161 if exp <= 60000 else 2893 if exp <= 100000 else 3625 if exp <= 150000 else 4358 if exp <= 200000 else 5070
+            }
+        }
+    },
+    'hr': {
+        'name': 'HR Services',
+        'icon': '👥',
+        'description': 'Employee relations, compliance, handbooks, onboarding, and HR advisory',
+        'tiers': {
+            1: {
+                'name': 'Foundation',
+                'response_time': '72 hours',
+                'description': 'Basic HR compliance & support',
+                'weekly_base': 250,
+                'per_ee': 21.67,
+                'features': ['Onboarding/offboarding packets', 'Offer letter templates', 'Basic compliance support', 'Employee document library']
+            },
+            2: {
+                'name': 'Growth',
+                'response_time': '24 hours',
+                'description': 'Comprehensive HR administration',
+                'weekly_base': 395,
+                'per_ee': 43.33,
+                'features': ['Everything in Foundation', 'Benefits administration', 'Job descriptions', 'Employee handbook', 'Performance reviews']
+            },
+            3: {
+                'name': 'Performance',
+                'response_time': '4 hours',
+                'description': 'Strategic HR partnership',
+                'weekly_base': 595,
+                'per_ee': 60.67,
+                'features': ['Everything in Growth', 'Employee & manager training', 'Disciplinary actions support', 'Talent acquisition']
+            }
+        }
+    },
+    'payroll': {
+        'name': 'Payroll',
+        'icon': '💵',
+        'description': 'Payroll processing, tax filings, direct deposit, W-2s, and time tracking',
+        'tiers': {
+            1: {
+                'name': 'Foundation',
+                'response_time': '48 hours',
+                'description': 'Standard payroll processing',
+                'weekly_base': 50,
+                'per_ee_weekly': 5,
+                'features': ['Bi-weekly/monthly payroll', 'Direct deposit', 'Tax filings', 'W-2/1099 preparation']
+            },
+            2: {
+                'name': 'Growth',
+                'response_time': '24 hours',
+                'description': 'Enhanced payroll with time tracking',
+                'weekly_base': 75,
+                'per_ee_weekly': 7.50,
+                'features': ['Everything in Foundation', 'Weekly payroll option', 'Time & attendance integration', 'PTO tracking', 'Multi-state support']
+            },
+            3: {
+                'name': 'Performance',
+                'response_time': 'Same day',
+                'description': 'Full-service payroll management',
+                'weekly_base': 100,
+                'per_ee_weekly': 10,
+                'features': ['Everything in Growth', 'On-demand pay', 'Custom reporting', 'Garnishment handling', 'Dedicated specialist']
+            }
+        }
+    },
+    'tax': {
+        'name': 'Tax Services',
+        'icon': '📋',
+        'description': 'Corporate tax preparation, filings, planning, and year-round support',
+        'tiers': {
+            1: {
+                'name': 'Starter',
+                'response_time': '5 business days',
+                'description': 'Simple tax situations',
+                'annual': 750,
+                'features': ['Federal corporate tax return', 'Single state filing', 'DE franchise tax', 'Tax extension filing']
+            },
+            2: {
+                'name': 'Essentials',
+                'response_time': '3 business days',
+                'description': 'Growing business tax needs',
+                'annual': 2450,
+                'features': ['Everything in Starter', 'City tax returns', 'Up to 10 1099s included', 'Quarterly check-ins']
+            },
+            3: {
+                'name': 'Standard',
+                'response_time': '24 hours',
+                'description': 'Complex tax situations',
+                'annual': 5400,
+                'features': ['Everything in Essentials', 'Multi-state filings', 'Up to 25 1099s included', 'Tax planning consultation']
+            }
+        }
+    },
+    'cfo': {
+        'name': 'CFO Services',
+        'icon': '📈',
+        'description': 'Financial modeling, budgeting, forecasting, investor reporting, and strategy',
+        'tiers': {
+            1: {
+                'name': 'Basic',
+                'response_time': '48 hours',
+                'description': 'Financial analysis & insights',
+                'monthly': 1750,
+                'features': ['Custom financial model', 'Budget vs actuals', 'KPI dashboard', 'Monthly strategy call']
+            },
+            2: {
+                'name': 'Essentials',
+                'response_time': '24 hours',
+                'description': 'Growth-stage financial leadership',
+                'monthly': 3150,
+                'features': ['Everything in Basic', 'Cash flow optimization', 'Investor reporting', 'Fundraising support', 'Bi-weekly calls']
+            },
+            3: {
+                'name': 'Custom',
+                'response_time': '4 hours',
+                'description': 'Full fractional CFO partnership',
+                'monthly': 5250,
+                'features': ['Everything in Essentials', '13-week cash flow forecast', 'Board presentations', 'M&A strategy', 'Weekly calls']
+            }
+        }
+    },
+    'coo': {
+        'name': 'COO / Operations',
+        'icon': '⚙️',
+        'description': 'Business setup, banking, vendor management, and operational support',
+        'tiers': {
+            1: {
+                'name': 'Starter',
+                'response_time': '72 hours',
+                'description': 'Business launch package',
+                'monthly': 62.50,
+                'features': ['Business incorporation', 'Banking setup', 'Payroll system setup', 'Bookkeeping setup']
+            },
+            2: {
+                'name': 'Essentials',
+                'response_time': '24 hours',
+                'description': 'Ongoing operations support',
+                'monthly': 500,
+                'features': ['Banking support', 'HR/payroll/benefits coordination', 'Invoice collection', 'Bill payment management']
+            },
+            3: {
+                'name': 'Custom',
+                'response_time': '4 hours',
+                'description': 'Full operations management',
+                'monthly': 1500,
+                'features': ['Everything in Essentials', 'High-volume AP/AR', 'Multi-state compliance', 'Stock administration']
+            }
+        }
+    }
+}
+
+# ============================================================================
+# DISCOUNT DATA
+# ============================================================================
+# (minimum services, rate), checked from the highest band down
+BUNDLE_DISCOUNTS = ((5, 0.30), (4, 0.25), (3, 0.20), (2, 0.18))
+
+# (minimum employees, rate), checked from the highest band down
+VOLUME_DISCOUNTS = ((100, 0.30), (51, 0.20), (26, 0.15), (11, 0.10))
+
+PAYMENT_DISCOUNTS = {
+    'Monthly': 0,
+    'Quarterly (5% off)': 0.05,
+    'Annual (15% off)': 0.15,
+    'Multi-year (20% off)': 0.20
+}
+
+MAX_DISCOUNT = 0.40
+
+# Upper bounds of the bookkeeping monthly-expense bands (inclusive)
+BOOKKEEPING_EXPENSE_BANDS = (30000, 60000, 100000, 150000, 200000)
+
+WEEKS_PER_MONTH = 4.33
+WEEKS_PER_YEAR = 52
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+def format_currency(amount: float) -> str:
+    """Format a number as USD currency."""
+    return f"${amount:,.0f}"
+
+def format_percent(amount: float) -> str:
+    """Format a decimal as percentage."""
+    return f"{amount * 100:.0f}%"
+
+def calculate_weekly_price(service: str, tier: int, employees: int, monthly_expenses: int) -> float:
+    """Calculate weekly price for a service tier."""
+    tier_data = PRICING[service]['tiers'][tier]
+    
+    if service == 'bookkeeping':
+        monthly = tier_data['get_price'](monthly_expenses)
+        return monthly / 4.33
+    elif service == 'hr':
+        return tier_data['weekly_base'] + (tier_data['per_ee'] * employees / 4.33)
+    elif service == 'payroll':
+        return tier_data['weekly_base'] + (tier_data['per_ee_weekly'] * employees)
+    elif service == 'tax':
+        return tier_data['annual'] / 52
+    else:  # cfo, coo
+        return tier_data['monthly'] / 4.33
+
+def get_auto_tax_tier(states: int, is_profitable: bool, monthly_revenue: int, 
+                      has_1099s: bool, num_1099s: int, entity_type: str) -> int:
+    """Auto-select minimum tax tier based on business complexity."""
+    complexity = 1
+    
+    # Calculate annual revenue from monthly
+    annual_revenue = monthly_revenue * 12
+    
+    if states > 1:
+        complexity = max(complexity, 3)
+    if is_profitable and annual_revenue > 500000:
+        complexity = max(complexity, 3)
+    if has_1099s and num_1099s > 10:
+        complexity = max(complexity, 3)
+    if has_1099s and 0 < num_1099s <= 10:
+        complexity = max(complexity, 2)
+    if entity_type == 'C-Corporation':
+        complexity = max(complexity, 2)
+    if annual_revenue > 1000000:
+        complexity = max(complexity, 2)
+    if annual_revenue > 5000000:
+        complexity = max(complexity, 3)
+    
+    return min(complexity, 3)
+
+def calculate_discounts(service_count: int, employees: int, payment_term: str) -> Dict[str, float]:
+    """Calculate all applicable discounts."""
+    # Bundle discount
+    bundle = 0
+    for min_services, rate in BUNDLE_DISCOUNTS:
+        if service_count >= min_services:
+            bundle = rate
+            break
+    
+    # Volume discount
+    volume = 0
+    for min_employees, rate in VOLUME_DISCOUNTS:
+        if employees >= min_employees:
+            volume = rate
+            break
+    
+    # Payment term discount
+    payment = PAYMENT_DISCOUNTS.get(payment_term, 0)
+    
+    total = min(bundle + volume + payment, MAX_DISCOUNT)
+    
+    return {
+        'bundle': bundle,
+        'volume': volume,
+        'payment': payment,
+        'total': total
+    }
+
+# ============================================================================
+# VECTORIZED PRICING
+# ============================================================================
+# Column order for tier matrices: one column per service, tier 0 = not selected
+SERVICE_KEYS = tuple(PRICING.keys())
+PAYMENT_TERMS = tuple(PAYMENT_DISCOUNTS.keys())
+
+def _tier_table(service: str, field: str) -> np.ndarray:
+    """Per-tier values of a PRICING field, indexed by tier (index 0 is zero)."""
+    tiers = PRICING[service]['tiers']
+    return np.array([0.0] + [float(tiers[t][field]) for t in (1, 2, 3)])
+
+def _bookkeeping_table() -> np.ndarray:
+    """Monthly bookkeeping price indexed by [tier, expense band]."""
+    probes = list(BOOKKEEPING_EXPENSE_BANDS) + [BOOKKEEPING_EXPENSE_BANDS[-1] + 1]
+    table = np.zeros((4, len(probes)))
+    for tier in (1, 2, 3):
+        get_price = PRICING['bookkeeping']['tiers'][tier]['get_price']
+        table[tier] = [get_price(exp) for exp in probes]
+    return table
+
+_BOOKKEEPING_MONTHLY = _bookkeeping_table()
+_HR_BASE = _tier_table('hr', 'weekly_base')
+_HR_PER_EE = _tier_table('hr', 'per_ee')
+_PAYROLL_BASE = _tier_table('payroll', 'weekly_base')
+_PAYROLL_PER_EE = _tier_table('payroll', 'per_ee_weekly')
+_TAX_ANNUAL = _tier_table('tax', 'annual')
+_CFO_MONTHLY = _tier_table('cfo', 'monthly')
+_COO_MONTHLY = _tier_table('coo', 'monthly')
+
+def _band_rates(bands: Sequence, default: float = 0.0):
+    """Split (minimum, rate) bands into ascending thresholds and rates."""
+    ordered = sorted(bands)
+    thresholds = np.array([minimum for minimum, _ in ordered])
+    rates = np.array([default] + [rate for _, rate in ordered])
+    return thresholds, rates
+
+@dataclass
+class DiscountPolicy:
+    """Bundle/volume bands, payment-term rates and cap used to discount a quote.
+    
+    Bands are (minimum, rate) pairs like BUNDLE_DISCOUNTS; payment terms
+    missing from `payment` get no discount.
+    """
+    bundle: Tuple[Tuple[int, float], ...] = BUNDLE_DISCOUNTS
+    volume: Tuple[Tuple[int, float], ...] = VOLUME_DISCOUNTS
+    payment: Dict[str, float] = field(default_factory=lambda: dict(PAYMENT_DISCOUNTS))
+    cap: float = MAX_DISCOUNT
+    name: str = 'current'
+    
+    def __post_init__(self):
+        self._bundle_thresholds, self._bundle_rates = _band_rates(self.bundle)
+        self._volume_thresholds, self._volume_rates = _band_rates(self.volume)
+        self._payment_rates = np.array([float(self.payment.get(term, 0)) for term in PAYMENT_TERMS])
+
+CURRENT_POLICY = DiscountPolicy()
+
+def bookkeeping_band(monthly_expenses) -> np.ndarray:
+    """Index of the bookkeeping expense band for each expense value."""
+    return np.searchsorted(BOOKKEEPING_EXPENSE_BANDS, monthly_expenses, side='left')
+
+def calculate_weekly_prices(tiers, employees, monthly_expenses) -> np.ndarray:
+    """Weekly price per service for many clients at once.
+    
+    `tiers` is an (n, len(SERVICE_KEYS)) integer matrix with 0 for services
+    that are not selected; `employees` and `monthly_expenses` have length n.
+    Returns an (n, len(SERVICE_KEYS)) matrix matching calculate_weekly_price.
+    """
+    tiers = np.asarray(tiers)
+    employees = np.asarray(employees, dtype=float)
+    prices = np.empty(tiers.shape)
+    
+    for col, service in enumerate(SERVICE_KEYS):
+        tier = tiers[:, col]
+        if service == 'bookkeeping':
+            price = _BOOKKEEPING_MONTHLY[tier, bookkeeping_band(monthly_expenses)] / WEEKS_PER_MONTH
+        elif service == 'hr':
+            price = _HR_BASE[tier] + (_HR_PER_EE[tier] * employees / WEEKS_PER_MONTH)
+        elif service == 'payroll':
+            price = _PAYROLL_BASE[tier] + (_PAYROLL_PER_EE[tier] * employees)
+        elif service == 'tax':
+            price = _TAX_ANNUAL[tier] / WEEKS_PER_YEAR
+        elif service == 'cfo':
+            price = _CFO_MONTHLY[tier] / WEEKS_PER_MONTH
+        else:  # coo
+            price = _COO_MONTHLY[tier] / WEEKS_PER_MONTH
+        prices[:, col] = np.where(tier > 0, price, 0.0)
+    
+    return prices
+
+def get_auto_tax_tiers(states, is_profitable, monthly_revenue, has_1099s, num_1099s, entity_type) -> np.ndarray:
+    """Vectorized get_auto_tax_tier over arrays of business inputs."""
+    states = np.asarray(states)
+    is_profitable = np.asarray(is_profitable, dtype=bool)
+    has_1099s = np.asarray(has_1099s, dtype=bool)
+    num_1099s = np.asarray(num_1099s)
+    annual_revenue = np.asarray(monthly_revenue) * 12
+    
+    tier_3 = ((states > 1)
+              | (is_profitable & (annual_revenue > 500000))
+              | (has_1099s & (num_1099s > 10))
+              | (annual_revenue > 5000000))
+    tier_2 = ((has_1099s & (num_1099s > 0) & (num_1099s <= 10))
+              | (np.asarray(entity_type) == 'C-Corporation')
+              | (annual_revenue > 1000000))
+    
+    return np.where(tier_3, 3, np.where(tier_2, 2, 1))
+
+def calculate_discounts_array(service_count, employees, payment_term,
+                              policy: Optional[DiscountPolicy] = None) -> Dict[str, np.ndarray]:
+    """Vectorized calculate_discounts; `payment_term` is an index into PAYMENT_TERMS.
+    
+    Uses the current discount policy unless a candidate `policy` is given.
+    """
+    policy = policy or CURRENT_POLICY
+    bundle = policy._bundle_rates[np.searchsorted(policy._bundle_thresholds, service_count, side='right')]
+    volume = policy._volume_rates[np.searchsorted(policy._volume_thresholds, employees, side='right')]
+    payment = policy._payment_rates[np.asarray(payment_term)]
+    
+    total = np.minimum(bundle + volume + payment, policy.cap)
+    
+    return {
+        'bundle': bundle,
+        'volume': volume,
+        'payment': payment,
+        'total': total
+    }
+
+@dataclass
+class ClientBook:
+    """Column-oriented book of clients for batch pricing.
+    
+    `tiers` holds the effective tier per service (tax already raised to the
+    auto-selected minimum) and `payment_term` indexes PAYMENT_TERMS.
+    """
+    employees: np.ndarray
+    monthly_expenses: np.ndarray
+    tiers: np.ndarray
+    payment_term: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.employees)
+    
+    @property
+    def service_count(self) -> np.ndarray:
+        return np.count_nonzero(self.tiers, axis=1)
+
+def price_book(book: ClientBook) -> Dict[str, np.ndarray]:
+    """Price every client in the book: per-service prices, discounts and totals."""
+    weekly_prices = calculate_weekly_prices(book.tiers, book.employees, book.monthly_expenses)
+    weekly_subtotal = weekly_prices.sum(axis=1)
+    discounts = calculate_discounts_array(book.service_count, book.employees, book.payment_term)
+    weekly_total = weekly_subtotal * (1 - discounts['total'])
+    
+    return {
+        'weekly_prices': weekly_prices,
+        'weekly_subtotal': weekly_subtotal,
+        'discounts': discounts,
+        'weekly_total': weekly_total
+    }
@@ -0,0 +1,582 @@
+"""
+Scout Financial - Pricing Differential Fuzzer
+Pins every fast pricing path to a frozen copy of the reference functions.
+
+The reference below is a verbatim snapshot of `calculate_weekly_price`,
+`get_auto_tax_tier` and `calculate_discounts` with the price data they used
+when the fast paths were introduced. It must not change when prices change;
+re-freeze it deliberately together with a price-book update.
+
+The proration engine is checked separately against a day-by-day
+recomputation of each client's charges with the same frozen reference.
+
+Each target draws random inputs mixed with boundary values (expense band
+edges, employee thresholds, tax revenue thresholds, the 40% cap), evaluates
+the reference and every registered implementation on the same batch,
+shrinks any mismatch to a minimal case and reports throughput.
+
+To run:
+    python pricing_fuzz.py --cases 1000000 --proration-clients 500 --seed 0
+"""
+
+import argparse
+import calendar
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import pricing
+import proration
+from forecast import _price_components
+from group_pricing import GroupEntity, quote_group
+
+# ============================================================================
+# FROZEN REFERENCE
+# ============================================================================
+_REFERENCE_TIERS = {
+    'bookkeeping': {
+        1: {'get_price': lambda exp: 845 if exp <= 30000 else 1278 if exp <= 60000 else 1712 if exp <= 100000 else 2145 if exp <= 150000 else 2578 if exp <= 200000 else 3000},
+        2: {'get_price': lambda exp: 1100 if exp <= 30000 else 1662 if exp <= 60000 else 2226 if exp <= 100000 else 2789 if exp <= 150000 else 3352 if exp <= 200000 else 3900},
+        3: {'get_price': lambda exp: 1430 if exp <= 30000 else 2161 if exp <= 60000 else 2893 if exp <= 100000 else 3625 if exp <= 150000 else 4358 if exp <= 200000 else 5070},
+    },
+    'hr': {
+        1: {'weekly_base': 250, 'per_ee': 21.67},
+        2: {'weekly_base': 395, 'per_ee': 43.33},
+        3: {'weekly_base': 595, 'per_ee': 60.67},
+    },
+    'payroll': {
+        1: {'weekly_base': 50, 'per_ee_weekly': 5},
+        2: {'weekly_base': 75, 'per_ee_weekly': 7.50},
+        3: {'weekly_base': 100, 'per_ee_weekly': 10},
+    },
+    'tax': {1: {'annual': 750}, 2: {'annual': 2450}, 3: {'annual': 5400}},
+    'cfo': {1: {'monthly': 1750}, 2: {'monthly': 3150}, 3: {'monthly': 5250}},
+    'coo': {1: {'monthly': 62.50}, 2: {'monthly': 500}, 3: {'monthly': 1500}},
+}
+
+def reference_weekly_price(service: str, tier: int, employees: int, monthly_expenses: int) -> float:
+    tier_data = _REFERENCE_TIERS[service][tier]
+
+    if service == 'bookkeeping':
+        monthly = tier_data['get_price'](monthly_expenses)
+        return monthly / 4.33
+    elif service == 'hr':
+        return tier_data['weekly_base'] + (tier_data['per_ee'] * employees / 4.33)
+    elif service == 'payroll':
+        return tier_data['weekly_base'] + (tier_data['per_ee_weekly'] * employees)
+    elif service == 'tax':
+        return tier_data['annual'] / 52
+    else:  # cfo, coo
+        return tier_data['monthly'] / 4.33
+
+def reference_auto_tax_tier(states: int, is_profitable: bool, monthly_revenue: int,
+                            has_1099s: bool, num_1099s: int, entity_type: str) -> int:
+    complexity = 1
+
+    # Calculate annual revenue from monthly
+    annual_revenue = monthly_revenue * 12
+
+    if states > 1:
+        complexity = max(complexity, 3)
+    if is_profitable and annual_revenue > 500000:
+        complexity = max(complexity, 3)
+    if has_1099s and num_1099s > 10:
+        complexity = max(complexity, 3)
+    if has_1099s and 0 < num_1099s <= 10:
+        complexity = max(complexity, 2)
+    if entity_type == 'C-Corporation':
+        complexity = max(complexity, 2)
+    if annual_revenue > 1000000:
+        complexity = max(complexity, 2)
+    if annual_revenue > 5000000:
+        complexity = max(complexity, 3)
+
+    return min(complexity, 3)
+
+def reference_discounts(service_count: int, employees: int, payment_term: str) -> Dict[str, float]:
+    # Bundle discount
+    if service_count >= 5:
+        bundle = 0.30
+    elif service_count >= 4:
+        bundle = 0.25
+    elif service_count >= 3:
+        bundle = 0.20
+    elif service_count >= 2:
+        bundle = 0.18
+    else:
+        bundle = 0
+
+    # Volume discount
+    if employees >= 100:
+        volume = 0.30
+    elif employees >= 51:
+        volume = 0.20
+    elif employees >= 26:
+        volume = 0.15
+    elif employees >= 11:
+        volume = 0.10
+    else:
+        volume = 0
+
+    # Payment term discount
+    payment_discounts = {
+        'Monthly': 0,
+        'Quarterly (5% off)': 0.05,
+        'Annual (15% off)': 0.15,
+        'Multi-year (20% off)': 0.20
+    }
+    payment = payment_discounts.get(payment_term, 0)
+
+    total = min(bundle + volume + payment, 0.40)
+
+    return {
+        'bundle': bundle,
+        'volume': volume,
+        'payment': payment,
+        'total': total
+    }
+
+def reference_weekly_total(employees: int, monthly_expenses: int, tier_bookkeeping: int, tier_hr: int,
+                           tier_payroll: int, tier_tax: int, tier_cfo: int, tier_coo: int,
+                           payment_term: str) -> float:
+    tiers = dict(zip(('bookkeeping', 'hr', 'payroll', 'tax', 'cfo', 'coo'),
+                     (tier_bookkeeping, tier_hr, tier_payroll, tier_tax, tier_cfo, tier_coo)))
+    weekly_subtotal = 0
+    for service, tier in tiers.items():
+        if tier:
+            weekly_subtotal += reference_weekly_price(service, tier, employees, monthly_expenses)
+    service_count = sum(1 for tier in tiers.values() if tier)
+    discounts = reference_discounts(service_count, employees, payment_term)
+    return weekly_subtotal * (1 - discounts['total'])
+
+# ============================================================================
+# INPUT GENERATORS
+# ============================================================================
+SERVICES = ('bookkeeping', 'hr', 'payroll', 'tax', 'cfo', 'coo')
+PAYMENT_TERMS = ('Monthly', 'Quarterly (5% off)', 'Annual (15% off)', 'Multi-year (20% off)')
+ENTITY_TYPES = ('LLC', 'S-Corporation', 'C-Corporation', 'Partnership', 'Sole Proprietorship', 'Nonprofit 501(c)(3)')
+
+EXPENSE_EDGES = (0, 1, 4999, 5000, 29999, 30000, 30001, 59999, 60000, 60001, 99999, 100000, 100001,
+                 149999, 150000, 150001, 199999, 200000, 200001, 495000, 500000, 2000000)
+EMPLOYEE_EDGES = (1, 2, 9, 10, 11, 12, 24, 25, 26, 27, 49, 50, 51, 52, 98, 99, 100, 101, 433, 1000)
+# Monthly revenue either side of the 500k, 1M and 5M annual thresholds
+REVENUE_EDGES = (0, 41666, 41667, 83333, 83334, 416666, 416667, 2000000)
+COUNT_1099_EDGES = (0, 1, 9, 10, 11, 12)
+
+@dataclass
+class Field:
+    """Input field: random range plus boundary values, shrinking toward `simplest`."""
+    low: int
+    high: int
+    edges: Sequence = ()
+    choices: Optional[Sequence] = None
+
+    def draw(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        if self.choices is not None:
+            return np.asarray(self.choices, dtype=object)[rng.integers(0, len(self.choices), n)]
+        values = rng.integers(self.low, self.high + 1, n)
+        if self.edges:
+            use_edge = rng.random(n) < 0.5
+            values = np.where(use_edge, np.asarray(self.edges)[rng.integers(0, len(self.edges), n)], values)
+        return values
+
+    def simpler(self, value) -> List:
+        """Candidate replacements for `value`, simplest first."""
+        if self.choices is not None:
+            return list(self.choices[:list(self.choices).index(value)])
+        value = int(value)
+        candidates = [self.low] + [edge for edge in self.edges if self.low <= edge < value]
+        step = (value - self.low) // 2
+        while step > 0:
+            candidates.append(value - step)
+            step //= 2
+        candidates.append(value - 1)
+        return [c for c in dict.fromkeys(candidates) if self.low <= c < value]
+
+# ============================================================================
+# TARGETS
+# ============================================================================
+@dataclass
+class Implementation:
+    """Batch implementation under test: inputs dict of arrays -> (n,) or (n, k) array."""
+    run: Callable[[Dict[str, np.ndarray]], np.ndarray]
+    rtol: float = 0.0
+
+@dataclass
+class Target:
+    name: str
+    fields: Dict[str, Field]
+    reference: Callable[..., object]
+    implementations: Dict[str, Implementation] = field(default_factory=dict)
+
+    def run_reference(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        names = list(self.fields)
+        columns = [inputs[name].tolist() for name in names]
+        results = [self.reference(*args) for args in zip(*columns)]
+        if results and isinstance(results[0], dict):
+            return np.array([[r['bundle'], r['volume'], r['payment'], r['total']] for r in results], dtype=float)
+        return np.array(results, dtype=float)
+
+def _scalar(function: Callable) -> Callable:
+    """Wrap a scalar implementation as a batch implementation."""
+    def run(inputs):
+        columns = [inputs[name].tolist() for name in inputs]
+        results = [function(*args) for args in zip(*columns)]
+        if results and isinstance(results[0], dict):
+            return np.array([[r['bundle'], r['volume'], r['payment'], r['total']] for r in results], dtype=float)
+        return np.array(results, dtype=float)
+    return run
+
+def _service_tiers(inputs: Dict[str, np.ndarray]) -> np.ndarray:
+    n = len(inputs['tier'])
+    tiers = np.zeros((n, len(pricing.SERVICE_KEYS)), dtype=np.int64)
+    columns = np.array([pricing.SERVICE_KEYS.index(s) for s in inputs['service']], dtype=np.int64)
+    tiers[np.arange(n), columns] = inputs['tier'].astype(np.int64)
+    return tiers, columns
+
+def _vectorized_weekly_price(inputs):
+    tiers, columns = _service_tiers(inputs)
+    prices = pricing.calculate_weekly_prices(tiers, inputs['employees'], inputs['monthly_expenses'])
+    return prices[np.arange(len(columns)), columns]
+
+def _forecast_weekly_price(inputs):
+    tiers, _ = _service_tiers(inputs)
+    book = pricing.ClientBook(inputs['employees'], inputs['monthly_expenses'], tiers,
+                              np.zeros(len(tiers), dtype=np.int64))
+    flat, per_employee, by_band = _price_components(book)
+    band = pricing.bookkeeping_band(inputs['monthly_expenses'])
+    return flat + per_employee * inputs['employees'] + by_band[np.arange(len(tiers)), band]
+
+def _vectorized_discounts(inputs):
+    terms = np.array([pricing.PAYMENT_TERMS.index(t) for t in inputs['payment_term']], dtype=np.int64)
+    d = pricing.calculate_discounts_array(inputs['service_count'], inputs['employees'], terms)
+    return np.column_stack([d['bundle'], d['volume'], d['payment'], d['total']])
+
+def _vectorized_tax_tier(inputs):
+    return pricing.get_auto_tax_tiers(
+        inputs['states'], inputs['is_profitable'].astype(bool), inputs['monthly_revenue'],
+        inputs['has_1099s'].astype(bool), inputs['num_1099s'], inputs['entity_type'].astype(str)
+    ).astype(float)
+
+def _policy_discounts(inputs):
+    """calculate_discounts_array through an explicitly built DiscountPolicy."""
+    policy = pricing.DiscountPolicy(
+        bundle=((2, 0.18), (3, 0.20), (4, 0.25), (5, 0.30)),
+        volume=((11, 0.10), (26, 0.15), (51, 0.20), (100, 0.30)),
+        payment={'Monthly': 0, 'Quarterly (5% off)': 0.05, 'Annual (15% off)': 0.15, 'Multi-year (20% off)': 0.20},
+        cap=0.40,
+        name='reference'
+    )
+    terms = np.array([pricing.PAYMENT_TERMS.index(t) for t in inputs['payment_term']], dtype=np.int64)
+    d = pricing.calculate_discounts_array(inputs['service_count'], inputs['employees'], terms, policy)
+    return np.column_stack([d['bundle'], d['volume'], d['payment'], d['total']])
+
+def _quote_book(inputs) -> pricing.ClientBook:
+    return pricing.ClientBook(
+        employees=inputs['employees'].astype(np.int64),
+        monthly_expenses=inputs['monthly_expenses'].astype(np.int64),
+        tiers=np.column_stack([inputs[f'tier_{service}'] for service in pricing.SERVICE_KEYS]).astype(np.int64),
+        payment_term=np.array([pricing.PAYMENT_TERMS.index(t) for t in inputs['payment_term']], dtype=np.int64)
+    )
+
+def _price_book_total(inputs):
+    return pricing.price_book(_quote_book(inputs))['weekly_total']
+
+def _proration_total(inputs):
+    """Weekly invoice from proration's segment repricing.
+
+    Every client opens the window empty and reaches the case's state through
+    events dated before the window, so the billed amount comes from a
+    forward-filled, repriced segment.
+    """
+    book = _quote_book(inputs)
+    n = len(book)
+    opening = pricing.ClientBook(np.ones(n, dtype=np.int64), np.zeros(n, dtype=np.int64),
+                                 np.zeros_like(book.tiers), book.payment_term)
+    state = np.column_stack([book.employees, book.monthly_expenses, book.tiers])
+    start = np.datetime64('2026-01-05')
+    events = proration.ChangeEvents(
+        client=np.repeat(np.arange(n), state.shape[1]),
+        day=np.full(state.size, start - 1),
+        field=np.tile(np.arange(state.shape[1]), n),
+        value=state.reshape(-1).astype(float)
+    )
+    return proration.prorate(opening, events, start.item(), periods=1, frequency='weekly').billed[:, 0]
+
+def _single_entity_group_total(inputs):
+    totals = []
+    for args in zip(*(inputs[name].tolist() for name in inputs)):
+        case = dict(zip(inputs, args))
+        entity = GroupEntity(
+            name='entity', parent=None, employees=case['employees'], monthly_expenses=case['monthly_expenses'],
+            tiers={service: case[f'tier_{service}'] for service in pricing.SERVICE_KEYS if case[f'tier_{service}']}
+        )
+        totals.append(quote_group([entity], case['payment_term']).weekly_total)
+    return np.array(totals)
+
+TARGETS = [
+    Target(
+        name='weekly_price',
+        fields={
+            'service': Field(0, 0, choices=SERVICES),
+            'tier': Field(1, 3),
+            'employees': Field(1, 5000, EMPLOYEE_EDGES),
+            'monthly_expenses': Field(0, 2000000, EXPENSE_EDGES),
+        },
+        reference=reference_weekly_price,
+        implementations={
+            'pricing.calculate_weekly_price': Implementation(_scalar(pricing.calculate_weekly_price)),
+            'pricing.calculate_weekly_prices': Implementation(_vectorized_weekly_price),
+            # Reassembled from per-employee components, so not bit-exact
+            'forecast._price_components': Implementation(_forecast_weekly_price, rtol=1e-12),
+        }
+    ),
+    Target(
+        name='auto_tax_tier',
+        fields={
+            'states': Field(1, 50, (1, 2, 50)),
+            'is_profitable': Field(0, 1),
+            'monthly_revenue': Field(0, 2000000, REVENUE_EDGES),
+            'has_1099s': Field(0, 1),
+            'num_1099s': Field(0, 200, COUNT_1099_EDGES),
+            'entity_type': Field(0, 0, choices=ENTITY_TYPES),
+        },
+        reference=reference_auto_tax_tier,
+        implementations={
+            'pricing.get_auto_tax_tier': Implementation(_scalar(pricing.get_auto_tax_tier)),
+            'pricing.get_auto_tax_tiers': Implementation(_vectorized_tax_tier),
+        }
+    ),
+    Target(
+        name='discounts',
+        fields={
+            'service_count': Field(0, 6, tuple(range(7))),
+            'employees': Field(1, 5000, EMPLOYEE_EDGES),
+            'payment_term': Field(0, 0, choices=PAYMENT_TERMS),
+        },
+        reference=reference_discounts,
+        implementations={
+            'pricing.calculate_discounts': Implementation(_scalar(pricing.calculate_discounts)),
+            'pricing.calculate_discounts_array': Implementation(_vectorized_discounts),
+            'pricing.DiscountPolicy': Implementation(_policy_discounts),
+        }
+    ),
+    Target(
+        name='weekly_total',
+        fields={
+            'employees': Field(1, 5000, EMPLOYEE_EDGES),
+            'monthly_expenses': Field(0, 2000000, EXPENSE_EDGES),
+            **{f'tier_{service}': Field(0, 3) for service in SERVICES},
+            'payment_term': Field(0, 0, choices=PAYMENT_TERMS),
+        },
+        reference=reference_weekly_total,
+        implementations={
+            'pricing.price_book': Implementation(_price_book_total),
+            'proration.prorate': Implementation(_proration_total),
+            'group_pricing.quote_group': Implementation(_single_entity_group_total),
+        }
+    ),
+]
+
+# ============================================================================
+# DIFFERENTIAL RUN
+# ============================================================================
+def _mismatches(expected: np.ndarray, actual: np.ndarray, rtol: float) -> np.ndarray:
+    """Row indices where an implementation disagrees with the reference."""
+    actual = np.asarray(actual, dtype=float).reshape(expected.shape)
+    if rtol:
+        bad = ~np.isclose(actual, expected, rtol=rtol, atol=0)
+    else:
+        bad = actual != expected
+    return np.flatnonzero(bad.reshape(len(expected), -1).any(axis=1))
+
+def _single(inputs: Dict[str, np.ndarray], row: int) -> Dict[str, object]:
+    return {name: values[row].item() if hasattr(values[row], 'item') else values[row]
+            for name, values in inputs.items()}
+
+def _fails(target: Target, implementation: Implementation, case: Dict[str, object]) -> bool:
+    inputs = {name: np.asarray([value], dtype=object if target.fields[name].choices else np.int64)
+              for name, value in case.items()}
+    return len(_mismatches(target.run_reference(inputs), implementation.run(inputs), implementation.rtol)) > 0
+
+def shrink(target: Target, implementation: Implementation, case: Dict[str, object]) -> Dict[str, object]:
+    """Greedily simplify a failing case while it keeps failing."""
+    case = dict(case)
+    progress = True
+    while progress:
+        progress = False
+        for name, spec in target.fields.items():
+            for candidate in spec.simpler(case[name]):
+                trial = dict(case, **{name: candidate})
+                if _fails(target, implementation, trial):
+                    case = trial
+                    progress = True
+                    break
+    return case
+
+@dataclass
+class FuzzReport:
+    target: str
+    implementation: str
+    cases: int
+    seconds: float
+    mismatches: int
+    minimal_case: Optional[Dict[str, object]] = None
+
+    @property
+    def throughput(self) -> float:
+        return self.cases / self.seconds if self.seconds else float('inf')
+
+def fuzz(cases: int = 1000000, seed: int = 0, batch_size: int = 100000,
+         targets: Sequence[Target] = TARGETS) -> List[FuzzReport]:
+    """Run every target's implementations against the reference."""
+    rng = np.random.default_rng(seed)
+    reports = []
+    for target in targets:
+        timings = {name: 0.0 for name in ['reference', *target.implementations]}
+        mismatches = {name: 0 for name in target.implementations}
+        first_failure = {}
+
+        for start in range(0, cases, batch_size):
+            n = min(batch_size, cases - start)
+            inputs = {name: spec.draw(rng, n) for name, spec in target.fields.items()}
+
+            began = time.perf_counter()
+            expected = target.run_reference(inputs)
+            timings['reference'] += time.perf_counter() - began
+
+            for name, implementation in target.implementations.items():
+                began = time.perf_counter()
+                actual = implementation.run(inputs)
+                timings[name] += time.perf_counter() - began
+                bad = _mismatches(expected, actual, implementation.rtol)
+                mismatches[name] += len(bad)
+                if len(bad) and name not in first_failure:
+                    first_failure[name] = _single(inputs, bad[0])
+
+        reports.append(FuzzReport(target.name, 'reference', cases, timings['reference'], 0))
+        for name, implementation in target.implementations.items():
+            minimal = shrink(target, implementation, first_failure[name]) if name in first_failure else None
+            reports.append(FuzzReport(target.name, name, cases, timings[name], mismatches[name], minimal))
+    return reports
+
+# ============================================================================
+# PRORATION CHECK
+# ============================================================================
+# Months per invoice and weeks per invoice for each payment term, frozen
+_REFERENCE_BILLING = {
+    'Monthly': (1, 4.33),
+    'Quarterly (5% off)': (3, 52 / 4),
+    'Annual (15% off)': (12, 52),
+    'Multi-year (20% off)': (12, 52),
+}
+
+def _reference_add_months(day: date, months: int) -> date:
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    return date(year, month + 1, min(day.day, calendar.monthrange(year, month + 1)[1]))
+
+def _reference_weekly_total(state: Dict[str, float], payment_term: str) -> float:
+    tiers = {service: int(state[f'tier_{service}']) for service in SERVICES if state[f'tier_{service}']}
+    employees = int(state['employees'])
+    subtotal = sum(reference_weekly_price(service, tier, employees, int(state['monthly_expenses']))
+                   for service, tier in tiers.items())
+    return subtotal * (1 - reference_discounts(len(tiers), employees, payment_term)['total'])
+
+def reference_prorate(state: Dict[str, float], payment_term: str, events: List[Tuple[date, str, float]],
+                      start: date, periods: int) -> Tuple[List[float], List[float]]:
+    """Billed and charged amounts per period for one client, one day at a time."""
+    months, weeks = _REFERENCE_BILLING[payment_term]
+    pending = sorted(events, key=lambda event: event[0])
+    state = dict(state)
+    billed, charged = [], []
+    for period in range(periods):
+        period_start = _reference_add_months(start, period * months)
+        period_end = _reference_add_months(start, (period + 1) * months)
+        period_days = (period_end - period_start).days
+        amount = 0.0
+        day = period_start
+        while day < period_end:
+            while pending and pending[0][0] <= day:
+                _, name, value = pending.pop(0)
+                state[name] = value
+            weekly_total = _reference_weekly_total(state, payment_term)
+            if day == period_start:
+                billed.append(weekly_total * weeks)
+            amount += weekly_total * weeks / period_days
+            day += timedelta(days=1)
+        charged.append(amount)
+    return billed, charged
+
+def check_proration(clients: int = 200, periods: int = 3, seed: int = 0,
+                    start: date = date(2026, 1, 31)) -> Dict[str, object]:
+    """Compare `proration.prorate` with the day-by-day reference on a random book."""
+    rng = np.random.default_rng(seed)
+    employee_field = Field(1, 500, EMPLOYEE_EDGES)
+    expense_field = Field(0, 500000, EXPENSE_EDGES)
+    book = pricing.ClientBook(
+        employees=employee_field.draw(rng, clients),
+        monthly_expenses=expense_field.draw(rng, clients),
+        tiers=rng.integers(0, 4, (clients, len(SERVICES))),
+        payment_term=rng.integers(0, len(PAYMENT_TERMS), clients)
+    )
+
+    records = []
+    for client in range(clients):
+        for _ in range(rng.integers(0, 7)):
+            day = start + timedelta(days=int(rng.integers(-60, 400)))
+            name = proration.FIELDS[rng.integers(0, len(proration.FIELDS))]
+            if name == 'employees':
+                value = int(employee_field.draw(rng, 1)[0])
+            elif name == 'monthly_expenses':
+                value = int(expense_field.draw(rng, 1)[0])
+            else:
+                value = int(rng.integers(0, 4))
+            records.append((client, day, name, value))
+
+    began = time.perf_counter()
+    result = proration.prorate(book, proration.ChangeEvents.from_records(records), start, periods)
+    seconds = time.perf_counter() - began
+
+    mismatches = []
+    for client in range(clients):
+        state = {'employees': book.employees[client], 'monthly_expenses': book.monthly_expenses[client],
+                 **{f'tier_{service}': book.tiers[client, i] for i, service in enumerate(SERVICES)}}
+        events = [(day, name, value) for c, day, name, value in records if c == client]
+        billed, charged = reference_prorate(state, PAYMENT_TERMS[book.payment_term[client]], events, start, periods)
+        if not (np.allclose(result.billed[client], billed, rtol=1e-9, atol=1e-9)
+                and np.allclose(result.charged[client], charged, rtol=1e-9, atol=1e-9)):
+            mismatches.append({'client': client, 'payment_term': PAYMENT_TERMS[book.payment_term[client]],
+                               'events': events, 'billed': billed, 'charged': charged,
+                               'prorated_billed': result.billed[client].tolist(),
+                               'prorated_charged': result.charged[client].tolist()})
+    return {'clients': clients, 'events': len(records), 'seconds': seconds, 'mismatches': mismatches}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Differential fuzzing of pricing fast paths.")
+    parser.add_argument('--cases', type=int, default=1000000, help="cases per target")
+    parser.add_argument('--proration-clients', type=int, default=200, help="clients in the proration check")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    failed = False
+    for report in fuzz(args.cases, args.seed):
+        status = 'reference' if report.implementation == 'reference' else (
+            'OK' if not report.mismatches else f'{report.mismatches} MISMATCHES')
+        print(f"{report.target:<14} {report.implementation:<34} {report.throughput:>14,.0f} cases/s  {status}")
+        if report.minimal_case is not None:
+            failed = True
+            print(f"{'':<14} minimal failing case: {report.minimal_case}")
+
+    check = check_proration(args.proration_clients, seed=args.seed)
+    status = 'OK' if not check['mismatches'] else f"{len(check['mismatches'])} MISMATCHES"
+    print(f"{'proration':<14} {'proration.prorate':<34} {check['clients']:>8,} clients, "
+          f"{check['events']:,} events  {status}")
+    if check['mismatches']:
+        failed = True
+        print(f"{'':<14} first failing client: {check['mismatches'][0]}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,168 @@
+"""
+Scout Financial - Proration
+Prorated charges and credits for mid-period tier and headcount changes.
+
+Each client starts the billing window in its ClientBook state and changes
+through a stream of dated events (new headcount, new monthly expenses or a
+new tier for one service). The engine turns the events into constant-state
+segments for the whole book at once, reprices every segment with the
+vectorized engine (so volume-discount band crossings are captured) and
+prorates each segment over the billing periods it overlaps by days.
+Every client is billed on its own cycle (monthly, quarterly or annual, per
+its payment term) unless one frequency is forced for the whole book.
+
+Per client and period it reports what was billed in advance (the state at
+the period start), the exact prorated charge, and the adjustment between the
+two (positive = extra charge, negative = credit).
+
+Example:
+    events = ChangeEvents.from_records([
+        (client, date(2026, 11, 12), 'tier_bookkeeping', 3),
+        (client, date(2026, 11, 20), 'employees', 55),
+    ])
+    result = prorate(book, events, start=date(2026, 11, 1), periods=1)
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from billing_schedule import BILLING_FREQUENCIES, PAYMENT_TERM_FREQUENCY, WEEKS_PER_INVOICE, add_months
+from pricing import PAYMENT_TERMS, SERVICE_KEYS, ClientBook, calculate_discounts_array, calculate_weekly_prices
+
+FIELDS = ('employees', 'monthly_expenses') + tuple(f'tier_{service}' for service in SERVICE_KEYS)
+
+# ============================================================================
+# EVENTS & RESULTS
+# ============================================================================
+@dataclass
+class ChangeEvents:
+    """Dated state changes: `field` indexes FIELDS, `value` is the new value."""
+    client: np.ndarray
+    day: np.ndarray           # datetime64[D]
+    field: np.ndarray
+    value: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[int, date, str, float]]) -> 'ChangeEvents':
+        """Events from (client index, date, field name, new value) tuples."""
+        records = list(records)
+        return cls(
+            client=np.array([r[0] for r in records], dtype=np.int64),
+            day=np.array([r[1] for r in records], dtype='datetime64[D]'),
+            field=np.array([FIELDS.index(r[2]) for r in records], dtype=np.int64),
+            value=np.array([r[3] for r in records], dtype=float)
+        )
+
+    def __len__(self) -> int:
+        return len(self.client)
+
+@dataclass
+class ProrationResult:
+    """Per-client, per-period dates and amounts; arrays are (clients, periods)."""
+    period_starts: np.ndarray
+    period_ends: np.ndarray
+    billed: np.ndarray
+    charged: np.ndarray
+
+    @property
+    def adjustment(self) -> np.ndarray:
+        return self.charged - self.billed
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """Replace NaNs with the last non-NaN value above them."""
+    valid = ~np.isnan(values)
+    last = np.maximum.accumulate(np.where(valid, np.arange(len(values)), 0))
+    return values[last]
+
+def _period_grid(start: date, periods: int, frequency: str):
+    step = BILLING_FREQUENCIES[frequency]
+    if step:
+        bounds = [add_months(start, k * step) for k in range(periods + 1)]
+        return np.array(bounds, dtype='datetime64[D]')
+    return np.datetime64(start, 'D') + np.arange(periods + 1) * 7
+
+def _client_frequencies(book: ClientBook, frequency: Optional[str]) -> np.ndarray:
+    """Billing frequency per client: its payment term's, or `frequency` for all."""
+    if frequency is None:
+        by_term = np.array([PAYMENT_TERM_FREQUENCY[term] for term in PAYMENT_TERMS])
+        return by_term[book.payment_term]
+    if frequency not in BILLING_FREQUENCIES:
+        raise ValueError(f"Unknown billing frequency: {frequency}")
+    return np.full(len(book), frequency)
+
+def prorate(book: ClientBook, events: ChangeEvents, start: date, periods: int = 1,
+            frequency: Optional[str] = None) -> ProrationResult:
+    """Prorate the book's charges over each client's next `periods` billing
+    periods from `start`; `frequency` forces one billing cycle for every client."""
+    n = len(book)
+    frequencies = _client_frequencies(book, frequency)
+    bounds = np.empty((n, periods + 1), dtype='datetime64[D]')
+    weeks_per_invoice = np.empty(n)
+    for name in np.unique(frequencies):
+        uses = frequencies == name
+        bounds[uses] = _period_grid(start, periods, str(name))
+        weeks_per_invoice[uses] = WEEKS_PER_INVOICE[str(name)]
+    window_start, window_end = np.datetime64(start, 'D'), bounds[:, -1]
+
+    # Events before the window set the opening state; later ones are ignored
+    in_window = events.day < window_end[events.client]
+    event_client = events.client[in_window]
+    event_date = events.day[in_window].astype('datetime64[D]')
+    event_day = np.maximum(event_date, window_start)
+    event_field = events.field[in_window]
+    event_value = events.value[in_window]
+
+    # One segment per client opening the window, then one per event. Events
+    # clamped to the window start still apply in date order, then input order.
+    segments = n + len(event_client)
+    client = np.concatenate([np.arange(n), event_client])
+    seg_start = np.concatenate([np.full(n, window_start), event_day]).astype('datetime64[D]')
+    dated = np.concatenate([np.full(n, np.iinfo(np.int64).min), event_date.astype(np.int64)])
+    order = np.concatenate([np.full(n, -1), np.arange(len(event_client))])
+    sort = np.lexsort((order, dated, seg_start, client))
+    client, seg_start = client[sort], seg_start[sort]
+
+    state = np.full((segments, len(FIELDS)), np.nan)
+    state[:n, 0] = book.employees
+    state[:n, 1] = book.monthly_expenses
+    state[:n, 2:] = book.tiers
+    state[n + np.arange(len(event_client)), event_field] = event_value
+    state = state[sort]
+    for col in range(len(FIELDS)):
+        state[:, col] = _forward_fill(state[:, col])
+
+    employees = state[:, 0]
+    tiers = state[:, 2:].astype(np.int64)
+    weekly_prices = calculate_weekly_prices(tiers, employees, state[:, 1])
+    discounts = calculate_discounts_array(np.count_nonzero(tiers, axis=1), employees, book.payment_term[client])
+    weekly_total = weekly_prices.sum(axis=1) * (1 - discounts['total'])
+    full_amount = weekly_total * weeks_per_invoice[client]
+
+    next_same_client = np.append(client[1:] == client[:-1], False)
+    seg_end = np.where(next_same_client, np.append(seg_start[1:], window_start), window_end[client])
+
+    # Sortable (client, day) key to find the segment in force at a period start
+    days = (seg_start - window_start).astype(np.int64)
+    span = int((window_end - window_start).astype(np.int64).max(initial=0)) + 1
+    keys = client * span + days
+
+    billed = np.zeros((n, periods))
+    charged = np.zeros((n, periods))
+    for p in range(periods):
+        p_start, p_end = bounds[client, p], bounds[client, p + 1]
+        period_days = (p_end - p_start).astype(np.int64)
+        overlap = (np.minimum(seg_end, p_end) - np.maximum(seg_start, p_start)).astype(np.int64)
+        overlap = np.clip(overlap, 0, None)
+        charged[:, p] = np.bincount(client, weights=full_amount * overlap / period_days, minlength=n)
+
+        query = np.arange(n) * span + (bounds[:, p] - window_start).astype(np.int64)
+        in_force = np.searchsorted(keys, query, side='right') - 1
+        billed[:, p] = full_amount[in_force]
+
+    return ProrationResult(period_starts=bounds[:, :-1], period_ends=bounds[:, 1:], billed=billed, charged=charged)
@@ -0,0 +1,210 @@
+"""
+Scout Financial - Quote Archive
+Append-only columnar archive of generated quotes for analytics.
+
+Each column is a raw fixed-width file in the archive directory, read back as
+a read-only numpy memmap (no copy, no full load). Industry, entity type and
+payment term are dictionary-encoded; the dictionaries live in
+`dictionaries.json` next to the column files.
+
+Example:
+    archive = QuoteArchive('quote_archive')
+    archive.append(quote)
+    archive.group_mean('discount_total', by='industry')
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pricing import SERVICE_KEYS
+
+# ============================================================================
+# SCHEMA
+# ============================================================================
+STRING_COLUMNS = ('industry', 'entity_type', 'payment_term')
+
+COLUMNS = {
+    'created_at': np.int64,          # unix seconds
+    'submitted': np.bool_,           # prospect requested the quote
+    'employees': np.int32,
+    'states': np.int16,
+    'monthly_expenses': np.int32,
+    'monthly_revenue': np.int32,
+    'is_profitable': np.bool_,
+    'has_1099s': np.bool_,
+    'num_1099s': np.int32,
+    **{name: np.uint8 for name in STRING_COLUMNS},
+    **{f'tier_{service}': np.int8 for service in SERVICE_KEYS},      # 0 = not selected
+    **{f'weekly_{service}': np.float64 for service in SERVICE_KEYS},
+    'discount_bundle': np.float32,
+    'discount_volume': np.float32,
+    'discount_payment': np.float32,
+    'discount_total': np.float32,
+    'weekly_subtotal': np.float64,
+    'weekly_total': np.float64,
+}
+
+DEFAULT_ARCHIVE_PATH = os.environ.get('SCOUT_QUOTE_ARCHIVE', 'quote_archive')
+
+def quote_columns(quote: Dict) -> Dict[str, object]:
+    """Flatten a quote dict (as built by the calculator) into archive columns."""
+    row = {name: quote.get(name, 0) for name in
+           ('employees', 'states', 'monthly_expenses', 'monthly_revenue',
+            'is_profitable', 'has_1099s', 'num_1099s')}
+    row['created_at'] = int(quote.get('created_at', time.time()))
+    row['submitted'] = quote.get('submitted', False)
+    for name in STRING_COLUMNS:
+        row[name] = quote[name]
+    for service in SERVICE_KEYS:
+        row[f'tier_{service}'] = quote['tiers'].get(service, 0)
+        row[f'weekly_{service}'] = quote['weekly_prices'].get(service, 0.0)
+    for component in ('bundle', 'volume', 'payment', 'total'):
+        row[f'discount_{component}'] = quote['discounts'][component]
+    row['weekly_subtotal'] = quote['weekly_subtotal']
+    row['weekly_total'] = quote['weekly_total']
+    return row
+
+# ============================================================================
+# ARCHIVE
+# ============================================================================
+class QuoteArchive:
+    """Directory of append-only column files."""
+
+    def __init__(self, path: str = DEFAULT_ARCHIVE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self._dictionaries = self._load_dictionaries()
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.path, f'{name}.col')
+
+    def _dictionary_path(self) -> str:
+        return os.path.join(self.path, 'dictionaries.json')
+
+    def _load_dictionaries(self) -> Dict[str, List[str]]:
+        try:
+            with open(self._dictionary_path(), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {name: [] for name in STRING_COLUMNS}
+
+    def _encode(self, name: str, values: Sequence[str]) -> np.ndarray:
+        """Dictionary-encode strings, adding unseen values to the dictionary."""
+        dictionary = self._dictionaries[name]
+        codes = {value: code for code, value in enumerate(dictionary)}
+        uniques, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+        for value in uniques.tolist():
+            if value not in codes:
+                codes[value] = len(dictionary)
+                dictionary.append(value)
+        if len(dictionary) > np.iinfo(COLUMNS[name]).max + 1:
+            raise ValueError(f"Too many distinct values for '{name}'")
+        mapping = np.array([codes[value] for value in uniques.tolist()], dtype=COLUMNS[name])
+        return mapping[inverse.reshape(-1)]
+
+    def __len__(self) -> int:
+        # A crash mid-append can leave some columns one batch longer than
+        # others; only rows present in every column are visible. Columns
+        # added to the schema after the archive was created are back-filled
+        # on the next append and do not hide existing rows.
+        rows = []
+        for name, dtype in COLUMNS.items():
+            try:
+                rows.append(os.path.getsize(self._column_path(name)) // np.dtype(dtype).itemsize)
+            except FileNotFoundError:
+                continue
+        return min(rows) if rows else 0
+
+    def _backfill_missing_columns(self, rows: int) -> None:
+        """Create column files added to the schema since the archive was written."""
+        for name, dtype in COLUMNS.items():
+            if not os.path.exists(self._column_path(name)):
+                with open(self._column_path(name), 'wb') as f:
+                    f.write(np.zeros(rows, dtype=dtype).tobytes())
+
+    def append(self, quote: Dict) -> None:
+        """Append a single quote."""
+        row = quote_columns(quote)
+        self.append_columns({name: [value] for name, value in row.items()})
+
+    def append_columns(self, columns: Dict[str, Sequence]) -> None:
+        """Append a batch of quotes given as one sequence per column."""
+        missing = set(COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Missing columns: {sorted(missing)}")
+
+        with self._lock:
+            rows = len(self)
+            self._backfill_missing_columns(rows)
+            self._dictionaries = self._load_dictionaries()
+            encoded = {}
+            for name, dtype in COLUMNS.items():
+                if name in STRING_COLUMNS:
+                    encoded[name] = self._encode(name, columns[name])
+                else:
+                    encoded[name] = np.asarray(columns[name], dtype=dtype)
+
+            with open(self._dictionary_path() + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(self._dictionaries, f)
+            os.replace(self._dictionary_path() + '.tmp', self._dictionary_path())
+
+            for name, values in encoded.items():
+                with open(self._column_path(name), 'r+b' if os.path.exists(self._column_path(name)) else 'wb') as f:
+                    # Drop any partial tail left by an interrupted append
+                    f.truncate(rows * values.itemsize)
+                    f.seek(0, os.SEEK_END)
+                    f.write(values.tobytes())
+
+    def snapshot(self) -> Tuple[int, Dict[str, List[str]]]:
+        """Row count plus dictionaries covering every code in those rows.
+
+        Appends write the dictionaries before the columns, so reading them
+        after the row count can only find extra, unused entries.
+        """
+        rows = len(self)
+        return rows, self._load_dictionaries()
+
+    def column(self, name: str, rows: Optional[int] = None) -> np.ndarray:
+        """Read-only memory-mapped view of one column (the first `rows` rows)."""
+        if rows is None:
+            rows = len(self)
+        if rows == 0:
+            return np.empty(0, dtype=COLUMNS[name])
+        if not os.path.exists(self._column_path(name)):
+            # Not back-filled yet; the default value for every existing row
+            return np.zeros(rows, dtype=COLUMNS[name])
+        return np.memmap(self._column_path(name), dtype=COLUMNS[name], mode='r', shape=(rows,))
+
+    def dictionary(self, name: str) -> List[str]:
+        """Decoded values of a dictionary-encoded column, indexed by code."""
+        return list(self._load_dictionaries()[name])
+
+    def scan(self, names: Sequence[str], chunk_rows: int = 1 << 22,
+             rows: Optional[int] = None, start: int = 0) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield consecutive row chunks of the given columns as memmap slices.
+
+        All columns cover the same rows (`start` up to `rows`, default the
+        current length) even if quotes are appended during the scan.
+        """
+        if rows is None:
+            rows = len(self)
+        columns = {name: self.column(name, rows) for name in names}
+        for start in range(start, rows, chunk_rows):
+            yield {name: values[start:start + chunk_rows] for name, values in columns.items()}
+
+    def group_mean(self, value: str, by: str, chunk_rows: int = 1 << 22) -> Dict[str, float]:
+        """Mean of a numeric column per value of a dictionary-encoded column."""
+        rows, dictionaries = self.snapshot()
+        labels = dictionaries[by]
+        sums = np.zeros(len(labels))
+        counts = np.zeros(len(labels))
+        for chunk in self.scan((value, by), chunk_rows, rows):
+            sums += np.bincount(chunk[by], weights=chunk[value], minlength=len(labels))
+            counts += np.bincount(chunk[by], minlength=len(labels))
+        return {label: float(sums[code] / counts[code]) for code, label in enumerate(labels) if counts[code]}
@@ -0,0 +1,488 @@
+"""
+Scout Financial - Quote Notification Outbox
+Emails quote requests to sales without blocking the Streamlit rerun.
+
+`QuoteOutbox.enqueue` only hands the message to an asyncio worker running on
+a background thread. The worker batches messages, delivers them over a small
+pool of persistent SMTP connections, retries temporary failures with
+exponential backoff and appends undeliverable messages to a dead-letter file.
+
+Configuration (environment):
+    SCOUT_SMTP_HOST, SCOUT_SMTP_PORT, SCOUT_SMTP_USER, SCOUT_SMTP_PASSWORD,
+    SCOUT_SMTP_STARTTLS, SCOUT_QUOTE_SENDER, SCOUT_SALES_EMAIL,
+    SCOUT_OUTBOX_DEAD_LETTER
+
+For local testing, `LocalSMTPServer` is a minimal SMTP stand-in that keeps
+received messages in memory and can delay or reject deliveries. Running the
+module checks batching, retries, dead-lettering and enqueue latency against it:
+    python quote_outbox.py
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import random
+import smtplib
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.message import EmailMessage
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from typing import Dict, List, Optional, Tuple
+
+from pricing import PRICING, WEEKS_PER_MONTH, WEEKS_PER_YEAR, format_currency, format_percent
+
+# ============================================================================
+# CONFIGURATION & MESSAGES
+# ============================================================================
+@dataclass
+class SMTPConfig:
+    """SMTP server and addressing for quote notifications."""
+    host: str
+    port: int
+    sender: str
+    recipient: str
+    username: Optional[str] = None
+    password: Optional[str] = None
+    starttls: bool = False
+    timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> Optional['SMTPConfig']:
+        """Config from the environment, or None if notifications are not set up."""
+        recipient = os.environ.get('SCOUT_SALES_EMAIL')
+        if not recipient:
+            return None
+        return cls(
+            host=os.environ.get('SCOUT_SMTP_HOST', 'localhost'),
+            port=int(os.environ.get('SCOUT_SMTP_PORT', '25')),
+            sender=os.environ.get('SCOUT_QUOTE_SENDER', recipient),
+            recipient=recipient,
+            username=os.environ.get('SCOUT_SMTP_USER'),
+            password=os.environ.get('SCOUT_SMTP_PASSWORD'),
+            starttls=os.environ.get('SCOUT_SMTP_STARTTLS', '').lower() in ('1', 'true', 'yes')
+        )
+
+def build_quote_email(quote: Dict, company_name: str, sender: str, recipient: str) -> EmailMessage:
+    """Plain-text email to sales with the full quote."""
+    lines = [
+        f"Company: {company_name or '(not provided)'}",
+        f"Industry: {quote['industry']}",
+        f"Entity type: {quote['entity_type']}",
+        f"Employees: {quote['employees']}",
+        f"States: {quote['states']}",
+        f"Monthly expenses: {format_currency(quote['monthly_expenses'])}",
+        f"Monthly revenue: {format_currency(quote['monthly_revenue'])}",
+        f"Profitable: {'Yes' if quote['is_profitable'] else 'No'}",
+        f"1099s: {quote['num_1099s'] if quote['has_1099s'] else 'None'}",
+        "",
+        "Services:",
+    ]
+    for service, tier in quote['tiers'].items():
+        tier_name = PRICING[service]['tiers'][tier]['name']
+        price = format_currency(quote['weekly_prices'][service])
+        lines.append(f"  {PRICING[service]['name']} ({tier_name}): {price}/wk")
+
+    discounts = quote['discounts']
+    lines += [
+        "",
+        f"Subtotal: {format_currency(quote['weekly_subtotal'])}/wk",
+        f"Payment terms: {quote['payment_term']}",
+        f"Discounts: bundle {format_percent(discounts['bundle'])}, "
+        f"volume {format_percent(discounts['volume'])}, "
+        f"payment {format_percent(discounts['payment'])}, "
+        f"total {format_percent(discounts['total'])}",
+        f"Weekly total: {format_currency(quote['weekly_total'])}",
+        f"Monthly equivalent: {format_currency(quote['weekly_total'] * WEEKS_PER_MONTH)}",
+        f"Annual total: {format_currency(quote['weekly_total'] * WEEKS_PER_YEAR)}",
+    ]
+
+    message = EmailMessage()
+    message['From'] = sender
+    message['To'] = recipient
+    message['Subject'] = f"Quote request: {company_name or 'New prospect'} - {format_currency(quote['weekly_total'])}/wk"
+    message.set_content('\n'.join(lines))
+    return message
+
+# ============================================================================
+# OUTBOX
+# ============================================================================
+@dataclass
+class _Envelope:
+    message: EmailMessage
+    attempts: int = 0
+
+class PermanentDeliveryError(Exception):
+    """The server rejected the message; retrying will not help."""
+
+class _Connection:
+    """Lazily (re)connected SMTP connection, used by one delivery at a time."""
+
+    def __init__(self, config: SMTPConfig):
+        self.config = config
+        self.smtp: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open a connection and finish the TLS/auth handshake, or close it."""
+        smtp = smtplib.SMTP(self.config.host, self.config.port, timeout=self.config.timeout)
+        try:
+            if self.config.starttls:
+                smtp.starttls()
+            if self.config.username:
+                smtp.login(self.config.username, self.config.password or '')
+        except (smtplib.SMTPException, OSError):
+            # Never keep a connection that is missing TLS or auth
+            smtp.close()
+            raise
+        return smtp
+
+    def send(self, message: EmailMessage) -> None:
+        if self.smtp is None:
+            self.smtp = self._connect()
+        try:
+            self.smtp.send_message(message)
+        except smtplib.SMTPRecipientsRefused as error:
+            raise PermanentDeliveryError(str(error)) from error
+        except smtplib.SMTPResponseException as error:
+            if error.smtp_code >= 500:
+                try:
+                    self.smtp.rset()
+                except (smtplib.SMTPException, OSError):
+                    self.close()
+                raise PermanentDeliveryError(f"{error.smtp_code} {error.smtp_error!r}") from error
+            self.close()
+            raise
+        except (smtplib.SMTPException, OSError):
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self.smtp is not None:
+            try:
+                self.smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self.smtp.close()
+            self.smtp = None
+
+_STOP = object()
+
+class QuoteOutbox:
+    """Background asyncio worker that batches and delivers quote emails."""
+
+    def __init__(self, config: SMTPConfig, dead_letter_path: Optional[str] = None,
+                 batch_size: int = 20, batch_window: float = 0.25, pool_size: int = 2,
+                 max_attempts: int = 5, backoff_base: float = 1.0, backoff_cap: float = 60.0):
+        self.config = config
+        self.dead_letter_path = dead_letter_path or os.environ.get(
+            'SCOUT_OUTBOX_DEAD_LETTER', 'quote_outbox_dead_letter.jsonl')
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.delivered = 0
+        self.batches = 0
+        self._retries = set()
+
+        self._connections = [_Connection(config) for _ in range(pool_size)]
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='quote-outbox-smtp')
+        self._loop = asyncio.new_event_loop()
+        self._queue: Optional[asyncio.Queue] = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, name='quote-outbox', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        # Streamlit keeps the outbox as a cached resource and never stops it;
+        # flush (or dead-letter) pending messages when the server exits.
+        atexit.register(self.stop)
+
+    def enqueue(self, message: EmailMessage) -> None:
+        """Queue a message for delivery; returns immediately."""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, _Envelope(message))
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Deliver everything already queued, then shut the worker down.
+
+        Messages still waiting for a retry are dead-lettered. Registered with
+        `atexit`, so a restart or redeploy also flushes the queue (sent on
+        the worker thread, since the executor no longer accepts work then);
+        whatever is still unsent after `timeout` seconds is lost with the
+        process.
+        """
+        atexit.unregister(self.stop)
+        if not self._thread.is_alive():
+            return
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, _STOP)
+        self._thread.join(timeout)
+        self._executor.shutdown(wait=True)
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue()
+        self._ready.set()
+        try:
+            self._loop.run_until_complete(self._worker())
+        finally:
+            for connection in self._connections:
+                connection.close()
+            self._loop.close()
+
+    async def _worker(self) -> None:
+        pool: asyncio.Queue = asyncio.Queue()
+        for connection in self._connections:
+            pool.put_nowait(connection)
+        deliveries = set()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = self._loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), max(deadline - self._loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            task = asyncio.create_task(self._deliver(pool, batch))
+            deliveries.add(task)
+            task.add_done_callback(deliveries.discard)
+
+        await asyncio.gather(*deliveries)
+        for retry in list(self._retries):
+            retry.cancel()
+        await asyncio.gather(*self._retries, return_exceptions=True)
+
+        # Retries that woke up while the last deliveries were in flight, and
+        # anything enqueued after the stop marker, are never read again
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                self._dead_letter(item, RuntimeError("outbox stopped"), reason='outbox stopped before delivery')
+
+    async def _deliver(self, pool: asyncio.Queue, batch: List[_Envelope]) -> None:
+        connection = await pool.get()
+        self.batches += 1
+        try:
+            failures = await self._loop.run_in_executor(self._executor, self._send_batch, connection, batch)
+        except RuntimeError:
+            # The executor refuses work once the interpreter is shutting down
+            # (before atexit handlers run); flush on the worker thread instead
+            failures = self._send_batch(connection, batch)
+        finally:
+            pool.put_nowait(connection)
+
+        self.delivered += len(batch) - len(failures)
+        for envelope, error in failures:
+            envelope.attempts += 1
+            if isinstance(error, PermanentDeliveryError):
+                self._dead_letter(envelope, error, reason='rejected by server')
+            elif envelope.attempts >= self.max_attempts:
+                self._dead_letter(envelope, error, reason='retries exhausted')
+            else:
+                retry = asyncio.create_task(self._retry(envelope, error))
+                self._retries.add(retry)
+                retry.add_done_callback(self._retries.discard)
+
+    @staticmethod
+    def _send_batch(connection: _Connection, batch: List[_Envelope]) -> List[Tuple[_Envelope, Exception]]:
+        """Send a batch over one connection (runs on an executor thread)."""
+        failures = []
+        for envelope in batch:
+            try:
+                connection.send(envelope.message)
+            except (PermanentDeliveryError, smtplib.SMTPException, OSError) as error:
+                failures.append((envelope, error))
+        return failures
+
+    async def _retry(self, envelope: _Envelope, error: Exception) -> None:
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (envelope.attempts - 1))
+        try:
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+        except asyncio.CancelledError:
+            self._dead_letter(envelope, error, reason='outbox stopped before retry')
+            raise
+        self._queue.put_nowait(envelope)
+
+    def _dead_letter(self, envelope: _Envelope, error: Exception, reason: str) -> None:
+        record = {
+            'time': time.time(),
+            'attempts': envelope.attempts,
+            'error': f"{type(error).__name__}: {error}",
+            'reason': reason,
+            'to': envelope.message['To'],
+            'subject': envelope.message['Subject'],
+            'message': envelope.message.as_string()
+        }
+        with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+# ============================================================================
+# LOCAL SMTP STAND-IN
+# ============================================================================
+class LocalSMTPServer:
+    """Minimal in-process SMTP server for end-to-end tests of the outbox.
+
+    `delay` seconds are spent on every DATA command, the first `fail_first`
+    messages are answered with a temporary 451 error and the next
+    `reject_first` with a permanent 554.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, delay: float = 0.0, fail_first: int = 0,
+                 reject_first: int = 0):
+        self.host = host
+        self.delay = delay
+        self.fail_first = fail_first
+        self.reject_first = reject_first
+        self.messages: List[EmailMessage] = []
+        self.connections = 0
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(asyncio.start_server(self._session, host, port))
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._thread = threading.Thread(target=self._loop.run_forever, name='local-smtp', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+
+        async def reply(line: str) -> None:
+            writer.write(line.encode() + b'\r\n')
+            await writer.drain()
+
+        await reply('220 localhost stand-in')
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode(errors='replace').strip().upper()
+            if command.startswith('EHLO'):
+                await reply('250-localhost')
+                await reply('250 8BITMIME')
+            elif command.startswith(('HELO', 'MAIL', 'RCPT', 'RSET', 'NOOP')):
+                await reply('250 OK')
+            elif command == 'DATA':
+                await reply('354 End data with <CR><LF>.<CR><LF>')
+                data = bytearray()
+                while True:
+                    chunk = await reader.readline()
+                    if chunk in (b'.\r\n', b'.\n', b''):
+                        break
+                    data += chunk[1:] if chunk.startswith(b'..') else chunk
+                await asyncio.sleep(self.delay)
+                if self.fail_first > 0:
+                    self.fail_first -= 1
+                    await reply('451 Temporary failure')
+                elif self.reject_first > 0:
+                    self.reject_first -= 1
+                    await reply('554 Transaction failed')
+                else:
+                    self.messages.append(BytesParser(policy=default_policy).parsebytes(bytes(data)))
+                    await reply('250 Queued')
+            elif command == 'QUIT':
+                await reply('221 Bye')
+                break
+            else:
+                await reply('502 Command not implemented')
+        writer.close()
+
+# ============================================================================
+# END-TO-END CHECK
+# ============================================================================
+def _check_message(n: int) -> EmailMessage:
+    message = EmailMessage()
+    message['From'] = 'quotes@localhost'
+    message['To'] = 'sales@localhost'
+    message['Subject'] = f"Check {n}"
+    message.set_content(f"Quote {n}")
+    return message
+
+def _dead_letters(path: str) -> List[Dict]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+    except FileNotFoundError:
+        return []
+
+def check_outbox(messages: int = 200) -> List[Tuple[str, bool, str]]:
+    """Run the outbox against LocalSMTPServer; returns (check, passed, detail)."""
+    results = []
+    workdir = tempfile.mkdtemp(prefix='quote-outbox-check-')
+
+    def run(name: str, server: LocalSMTPServer, count: int, expected: int,
+            **options) -> Tuple[QuoteOutbox, List[Dict]]:
+        dead_letter_path = os.path.join(workdir, f'{name}.jsonl')
+        outbox = QuoteOutbox(SMTPConfig('127.0.0.1', server.port, 'quotes@localhost', 'sales@localhost'),
+                             dead_letter_path=dead_letter_path, **options)
+        for n in range(count):
+            outbox.enqueue(_check_message(n))
+        # Let retries run out before stopping (stop() dead-letters pending retries)
+        deadline = time.monotonic() + 30
+        while len(server.messages) < expected and time.monotonic() < deadline:
+            time.sleep(0.05)
+        outbox.stop()
+        server.stop()
+        return outbox, _dead_letters(dead_letter_path)
+
+    # Batching: a burst shares a few batches over the persistent pool
+    server = LocalSMTPServer()
+    outbox, dead = run('batching', server, messages, messages, batch_size=20, pool_size=2)
+    results.append(('batching', len(server.messages) == messages and outbox.batches < messages
+                    and server.connections <= 2 and not dead,
+                    f"{len(server.messages)}/{messages} delivered in {outbox.batches} batches "
+                    f"over {server.connections} connections"))
+
+    # Temporary 451 failures are retried with backoff
+    server = LocalSMTPServer(fail_first=3)
+    outbox, dead = run('retry', server, 5, 5, backoff_base=0.05)
+    results.append(('451 retry', len(server.messages) == 5 and not dead,
+                    f"{len(server.messages)}/5 delivered after 3 temporary failures"))
+
+    # Permanent 5xx rejections are dead-lettered without retrying
+    server = LocalSMTPServer(reject_first=1)
+    outbox, dead = run('reject', server, 3, 2, backoff_base=0.05)
+    rejected = [record for record in dead if record['reason'] == 'rejected by server' and record['attempts'] == 1]
+    results.append(('5xx dead letter', len(server.messages) == 2 and len(rejected) == 1 and len(dead) == 1,
+                    f"{len(server.messages)}/3 delivered, {len(rejected)} dead-lettered after one attempt"))
+
+    # Enqueue must never wait for SMTP: no call may take as long as one delivery
+    smtp_delay = 0.05
+    server = LocalSMTPServer(delay=smtp_delay)
+    outbox = QuoteOutbox(SMTPConfig('127.0.0.1', server.port, 'quotes@localhost', 'sales@localhost'),
+                         dead_letter_path=os.path.join(workdir, 'latency.jsonl'))
+    timings = []
+    for n in range(messages):
+        message = _check_message(n)
+        began = time.perf_counter()
+        outbox.enqueue(message)
+        timings.append(time.perf_counter() - began)
+    outbox.stop()
+    server.stop()
+    p99 = sorted(timings)[int(len(timings) * 0.99) - 1]
+    results.append(('enqueue latency', max(timings) < smtp_delay,
+                    f"median {statistics.median(timings) * 1e6:.0f}us, p99 {p99 * 1e6:.0f}us, "
+                    f"max {max(timings) * 1e6:.0f}us with {smtp_delay * 1e3:.0f}ms per SMTP delivery"))
+    return results
+
+if __name__ == '__main__':
+    failed = False
+    for check, passed, detail in check_outbox():
+        failed |= not passed
+        print(f"{check:<16} {'OK' if passed else 'FAILED':<7} {detail}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,258 @@
+"""
+Scout Financial - Quote Rollups
+Pre-aggregated quote analytics for the management dashboard.
+
+Rollup tables in SQLite hold counts and sums per group (event, industry,
+entity type, employee band, payment term) and are updated incrementally as
+each quote is generated or submitted, so dashboard queries scan groups, not
+quotes. `rebuild` recomputes them from the quote archive and `verify`
+compares the incremental tables against such a rebuild.
+"""
+
+import math
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from pricing import SERVICE_KEYS, VOLUME_DISCOUNTS
+from quote_archive import STRING_COLUMNS, QuoteArchive
+
+# ============================================================================
+# GROUPING
+# ============================================================================
+EVENTS = ('generated', 'submitted')
+DIMENSIONS = ('industry', 'entity_type', 'employee_band', 'payment_term')
+GROUP_COLUMNS = ('event',) + DIMENSIONS
+DISCOUNT_COMPONENTS = ('bundle', 'volume', 'payment', 'total')
+
+# Employee bands follow the volume-discount breakpoints
+_BAND_STARTS = sorted(minimum for minimum, _ in VOLUME_DISCOUNTS)
+EMPLOYEE_BANDS = tuple(
+    [f'1-{_BAND_STARTS[0] - 1}']
+    + [f'{start}-{end - 1}' for start, end in zip(_BAND_STARTS, _BAND_STARTS[1:])]
+    + [f'{_BAND_STARTS[-1]}+']
+)
+
+DEFAULT_ROLLUP_PATH = os.environ.get('SCOUT_QUOTE_ROLLUPS', 'quote_rollups.db')
+
+# Seconds a writer waits for another process's transaction (e.g. a rebuild swap)
+BUSY_TIMEOUT = 30.0
+
+def employee_band_index(employees) -> np.ndarray:
+    """Index into EMPLOYEE_BANDS for each headcount."""
+    return np.searchsorted(_BAND_STARTS, employees, side='right')
+
+def _aggregate(codes: Dict[str, np.ndarray], labels: Dict[str, Sequence[str]],
+               tiers: Dict[str, np.ndarray], discounts: Dict[str, np.ndarray],
+               weekly_total: np.ndarray) -> Tuple[list, list, list]:
+    """Aggregate a batch of quotes into rollup rows.
+
+    `codes` holds an integer code per quote for every GROUP_COLUMNS entry and
+    `labels` the matching label lists.
+    """
+    combined = np.zeros(len(weekly_total), dtype=np.int64)
+    for name in GROUP_COLUMNS:
+        combined = combined * len(labels[name]) + codes[name]
+    keys, inverse = np.unique(combined, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    groups = []
+    for key in keys.tolist():
+        parts = []
+        for name in reversed(GROUP_COLUMNS):
+            key, code = divmod(key, len(labels[name]))
+            parts.append(labels[name][code])
+        groups.append(tuple(reversed(parts)))
+
+    counts = np.bincount(inverse, minlength=len(keys))
+    sums = np.bincount(inverse, weights=weekly_total, minlength=len(keys))
+    group_rows = [(*group, int(count), float(total)) for group, count, total in zip(groups, counts, sums)]
+
+    tier_rows = []
+    for service in SERVICE_KEYS:
+        mix = np.bincount(inverse * 4 + tiers[service], minlength=len(keys) * 4).reshape(len(keys), 4)
+        for group, tier in zip(*np.nonzero(mix)):
+            tier_rows.append((*groups[group], service, int(tier), int(mix[group, tier])))
+
+    discount_rows = []
+    for component in DISCOUNT_COMPONENTS:
+        rate_pct = np.rint(np.asarray(discounts[component], dtype=float) * 100).astype(np.int64)
+        mix = np.bincount(inverse * 101 + rate_pct, minlength=len(keys) * 101).reshape(len(keys), 101)
+        for group, pct in zip(*np.nonzero(mix)):
+            discount_rows.append((*groups[group], component, int(pct), int(mix[group, pct])))
+
+    return group_rows, tier_rows, discount_rows
+
+# ============================================================================
+# ROLLUP STORE
+# ============================================================================
+_GROUP_SQL = ', '.join(GROUP_COLUMNS)
+_GROUP_DDL = ', '.join(f'{name} TEXT NOT NULL' for name in GROUP_COLUMNS)
+_PLACEHOLDERS = ', '.join('?' for _ in GROUP_COLUMNS)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS quote_rollup (
+    {_GROUP_DDL}, quote_count INTEGER NOT NULL, weekly_total_sum REAL NOT NULL,
+    PRIMARY KEY ({_GROUP_SQL})
+);
+CREATE TABLE IF NOT EXISTS tier_rollup (
+    {_GROUP_DDL}, service TEXT NOT NULL, tier INTEGER NOT NULL, quote_count INTEGER NOT NULL,
+    PRIMARY KEY ({_GROUP_SQL}, service, tier)
+);
+CREATE TABLE IF NOT EXISTS discount_rollup (
+    {_GROUP_DDL}, component TEXT NOT NULL, rate_pct INTEGER NOT NULL, quote_count INTEGER NOT NULL,
+    PRIMARY KEY ({_GROUP_SQL}, component, rate_pct)
+);
+"""
+
+class QuoteRollups:
+    """Incrementally maintained rollup tables."""
+
+    def __init__(self, path: str = DEFAULT_ROLLUP_PATH, timeout: float = BUSY_TIMEOUT):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def _apply(self, group_rows: list, tier_rows: list, discount_rows: list) -> None:
+        """Upsert aggregate rows; the caller owns the transaction."""
+        self._db.executemany(
+            f"INSERT INTO quote_rollup VALUES ({_PLACEHOLDERS}, ?, ?) "
+            f"ON CONFLICT ({_GROUP_SQL}) DO UPDATE SET "
+            "quote_count = quote_count + excluded.quote_count, "
+            "weekly_total_sum = weekly_total_sum + excluded.weekly_total_sum",
+            group_rows)
+        self._db.executemany(
+            f"INSERT INTO tier_rollup VALUES ({_PLACEHOLDERS}, ?, ?, ?) "
+            f"ON CONFLICT ({_GROUP_SQL}, service, tier) DO UPDATE SET "
+            "quote_count = quote_count + excluded.quote_count",
+            tier_rows)
+        self._db.executemany(
+            f"INSERT INTO discount_rollup VALUES ({_PLACEHOLDERS}, ?, ?, ?) "
+            f"ON CONFLICT ({_GROUP_SQL}, component, rate_pct) DO UPDATE SET "
+            "quote_count = quote_count + excluded.quote_count",
+            discount_rows)
+
+    def record(self, quote: Dict) -> None:
+        """Add one generated or submitted quote (a calculator quote dict)."""
+        values = {
+            'event': EVENTS[bool(quote.get('submitted', False))],
+            'employee_band': EMPLOYEE_BANDS[int(employee_band_index(quote['employees']))],
+            **{name: quote[name] for name in STRING_COLUMNS},
+        }
+        rows = _aggregate(
+            codes={name: np.zeros(1, dtype=np.int64) for name in GROUP_COLUMNS},
+            labels={name: [values[name]] for name in GROUP_COLUMNS},
+            tiers={service: np.array([quote['tiers'].get(service, 0)]) for service in SERVICE_KEYS},
+            discounts={component: np.array([quote['discounts'][component]]) for component in DISCOUNT_COMPONENTS},
+            weekly_total=np.array([quote['weekly_total']], dtype=float)
+        )
+        with self._lock, self._db:
+            self._apply(*rows)
+
+    def _archive_rows(self, archive: QuoteArchive, dictionaries: Dict[str, List[str]],
+                      start: int, rows: int, chunk_rows: int) -> Tuple[list, list, list]:
+        """Rollup rows for archive rows [start, rows), one batch per chunk."""
+        labels = {name: dictionaries[name] for name in STRING_COLUMNS}
+        labels['event'] = EVENTS
+        labels['employee_band'] = EMPLOYEE_BANDS
+        names = (('submitted', 'employees', 'weekly_total') + STRING_COLUMNS
+                 + tuple(f'tier_{service}' for service in SERVICE_KEYS)
+                 + tuple(f'discount_{component}' for component in DISCOUNT_COMPONENTS))
+
+        group_rows, tier_rows, discount_rows = [], [], []
+        for chunk in archive.scan(names, chunk_rows, rows, start):
+            codes = {name: chunk[name].astype(np.int64) for name in STRING_COLUMNS}
+            codes['event'] = chunk['submitted'].astype(np.int64)
+            codes['employee_band'] = employee_band_index(chunk['employees'])
+            groups, tiers, discounts = _aggregate(
+                codes, labels,
+                tiers={service: chunk[f'tier_{service}'].astype(np.int64) for service in SERVICE_KEYS},
+                discounts={component: chunk[f'discount_{component}'] for component in DISCOUNT_COMPONENTS},
+                weekly_total=np.asarray(chunk['weekly_total'], dtype=float)
+            )
+            group_rows += groups
+            tier_rows += tiers
+            discount_rows += discounts
+        return group_rows, tier_rows, discount_rows
+
+    def rebuild(self, archive: QuoteArchive, chunk_rows: int = 1 << 22) -> None:
+        """Replace the rollups with aggregates recomputed from the archive.
+
+        The archive is aggregated without holding the database write lock;
+        only the swap runs in one short write transaction, which also picks
+        up quotes archived meanwhile. Readers see the old rollups until the
+        commit, and record() calls from other processes wait for it.
+        """
+        rows, dictionaries = archive.snapshot()
+        scanned = self._archive_rows(archive, dictionaries, 0, rows, chunk_rows)
+
+        with self._lock, self._db:
+            self._db.execute("BEGIN IMMEDIATE")
+            # Quotes recorded before this point are in the archive up to
+            # `latest`; later record() calls wait for the commit
+            latest, dictionaries = archive.snapshot()
+            appended = self._archive_rows(archive, dictionaries, rows, latest, chunk_rows)
+            for table in ('quote_rollup', 'tier_rollup', 'discount_rollup'):
+                self._db.execute(f"DELETE FROM {table}")
+            self._apply(*scanned)
+            self._apply(*appended)
+
+    def verify(self, archive: QuoteArchive) -> List[str]:
+        """Compare the rollups with a rebuild from the archive; returns mismatches."""
+        expected = QuoteRollups(':memory:')
+        expected.rebuild(archive)
+
+        mismatches = []
+        for table in ('quote_rollup', 'tier_rollup', 'discount_rollup'):
+            actual_rows = self._table(table)
+            expected_rows = expected._table(table)
+            for key in sorted(set(actual_rows) | set(expected_rows)):
+                actual = actual_rows.get(key)
+                wanted = expected_rows.get(key)
+                if actual is None or wanted is None or not all(
+                        math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6) for a, b in zip(actual, wanted)):
+                    mismatches.append(f"{table} {key}: rollup={actual} rebuilt={wanted}")
+        return mismatches
+
+    def _table(self, table: str) -> Dict[tuple, tuple]:
+        key_columns = {'quote_rollup': 0, 'tier_rollup': 2, 'discount_rollup': 2}[table] + len(GROUP_COLUMNS)
+        with self._lock:
+            rows = self._db.execute(f"SELECT * FROM {table}").fetchall()
+        return {row[:key_columns]: row[key_columns:] for row in rows}
+
+    # ------------------------------------------------------------------------
+    # Dashboard queries
+    # ------------------------------------------------------------------------
+    def _dimensions(self, by: Sequence[str]) -> List[str]:
+        unknown = set(by) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown dimensions: {sorted(unknown)}")
+        return list(by)
+
+    def _query(self, table: str, columns: List[str], measures: str, event: str) -> List[Dict]:
+        select = ', '.join(columns + [measures])
+        grouping = f" GROUP BY {', '.join(columns)} ORDER BY {', '.join(columns)}" if columns else ""
+        with self._lock:
+            cursor = self._db.execute(f"SELECT {select} FROM {table} WHERE event = ?{grouping}", (event,))
+            names = [description[0] for description in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def summary(self, by: Sequence[str], event: str = 'generated') -> List[Dict]:
+        """Quote count and average weekly total per group."""
+        return self._query(
+            'quote_rollup', self._dimensions(by),
+            "SUM(quote_count) AS quotes, SUM(weekly_total_sum) / SUM(quote_count) AS avg_weekly_total",
+            event)
+
+    def tier_mix(self, by: Sequence[str], event: str = 'generated') -> List[Dict]:
+        """Quote count per service and tier (0 = not selected) per group."""
+        return self._query('tier_rollup', self._dimensions(by) + ['service', 'tier'],
+                           "SUM(quote_count) AS quotes", event)
+
+    def discount_mix(self, by: Sequence[str], event: str = 'generated') -> List[Dict]:
+        """Quote count per discount component and rate (in percent) per group."""
+        return self._query('discount_rollup', self._dimensions(by) + ['component', 'rate_pct'],
+                           "SUM(quote_count) AS quotes", event)
@@ -0,0 +1,288 @@
+"""
+Scout Financial - Static Pricing Pages
+Pre-renders the public tier cards and price tables as static HTML so browsing
+visitors never need a Streamlit session.
+
+Tier prices only depend on coarse inputs: bookkeeping on the monthly-expenses
+slider position (101 positions), HR and payroll on headcount (a fixed set of
+employee breakpoints), tax/CFO/COO on nothing. Each page records a
+fingerprint of its rendered HTML in `manifest.json`, so after a price-book,
+template or theme change only the affected pages are rewritten. Every page links to
+the live calculator with the visitor's inputs pre-filled.
+
+To build:
+    python static_pages.py site/ --calculator-url https://calculator.example.com/
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, NamedTuple
+from urllib.parse import urlencode
+
+from pricing import PRICING, SERVICE_KEYS, BOOKKEEPING_EXPENSE_BANDS, calculate_weekly_price, format_currency
+from theme import APP_CSS, tier_card_html
+
+EXPENSE_POSITIONS = tuple(range(0, 500001, 5000))      # monthly-expenses slider
+EMPLOYEE_BREAKPOINTS = (1, 5, 10, 11, 15, 20, 25, 26, 35, 50, 51, 75, 99, 100, 150, 200, 250, 500)
+DEFAULT_EMPLOYEES = 10
+DEFAULT_EXPENSES = 50000
+
+# ============================================================================
+# PAGE DATA
+# ============================================================================
+class Page(NamedTuple):
+    path: str
+    data: Dict
+    render: Callable[[Dict], str]
+
+def _input_kind(service: str) -> str:
+    """Which visitor input a service's price depends on."""
+    if service == 'bookkeeping':
+        return 'monthly_expenses'
+    if service in ('hr', 'payroll'):
+        return 'employees'
+    return ''
+
+def _service_path(service: str, value: int = 0) -> str:
+    kind = _input_kind(service)
+    if kind == 'monthly_expenses':
+        return f'{service}/expenses-{value}.html'
+    if kind == 'employees':
+        return f'{service}/employees-{value}.html'
+    return f'{service}/index.html'
+
+def _default_service_path(service: str) -> str:
+    kind = _input_kind(service)
+    return _service_path(service, DEFAULT_EXPENSES if kind == 'monthly_expenses' else DEFAULT_EMPLOYEES)
+
+def _tiers(service: str, employees: int, monthly_expenses: int) -> List[Dict]:
+    tiers = []
+    for tier_num, tier_data in PRICING[service]['tiers'].items():
+        tiers.append({
+            'tier': tier_num,
+            'name': tier_data['name'],
+            'description': tier_data['description'],
+            'response_time': tier_data['response_time'],
+            'features': tier_data['features'],
+            'price': calculate_weekly_price(service, tier_num, employees, monthly_expenses)
+        })
+    return tiers
+
+def _service_page(service: str, value: int, calculator_url: str) -> Page:
+    kind = _input_kind(service)
+    employees = value if kind == 'employees' else DEFAULT_EMPLOYEES
+    monthly_expenses = value if kind == 'monthly_expenses' else DEFAULT_EXPENSES
+    options = {'monthly_expenses': EXPENSE_POSITIONS, 'employees': EMPLOYEE_BREAKPOINTS}.get(kind, ())
+    data = {
+        'service': service,
+        'name': PRICING[service]['name'],
+        'icon': PRICING[service]['icon'],
+        'description': PRICING[service]['description'],
+        'kind': kind,
+        'value': value,
+        'options': list(options),
+        'tiers': _tiers(service, employees, monthly_expenses),
+        'quote_url': f"{calculator_url}?{urlencode({'employees': employees, 'monthly_expenses': monthly_expenses})}",
+    }
+    return Page(_service_path(service, value), data, _render_service)
+
+def _price_table_page(calculator_url: str) -> Page:
+    rows = []
+    for service in SERVICE_KEYS:
+        kind = _input_kind(service)
+        if kind == 'monthly_expenses':
+            values = [(f"Expenses up to {format_currency(band)}/mo", DEFAULT_EMPLOYEES, band)
+                      for band in BOOKKEEPING_EXPENSE_BANDS]
+            values.append((f"Expenses over {format_currency(BOOKKEEPING_EXPENSE_BANDS[-1])}/mo",
+                           DEFAULT_EMPLOYEES, BOOKKEEPING_EXPENSE_BANDS[-1] + 5000))
+        elif kind == 'employees':
+            values = [(f"{n} employee{'s' if n > 1 else ''}", n, DEFAULT_EXPENSES) for n in EMPLOYEE_BREAKPOINTS]
+        else:
+            values = [('All businesses', DEFAULT_EMPLOYEES, DEFAULT_EXPENSES)]
+        for label, employees, monthly_expenses in values:
+            rows.append({
+                'service': PRICING[service]['name'],
+                'label': label,
+                'prices': [tier['price'] for tier in _tiers(service, employees, monthly_expenses)]
+            })
+    data = {'rows': rows, 'quote_url': calculator_url}
+    return Page('price-table.html', data, _render_price_table)
+
+def _index_page(calculator_url: str) -> Page:
+    data = {
+        'services': [
+            {'name': PRICING[s]['name'], 'icon': PRICING[s]['icon'],
+             'description': PRICING[s]['description'], 'path': _default_service_path(s)}
+            for s in SERVICE_KEYS
+        ],
+        'quote_url': calculator_url,
+    }
+    return Page('index.html', data, _render_index)
+
+def build_pages(calculator_url: str) -> List[Page]:
+    """Every page of the static site with the data it renders."""
+    pages = [_index_page(calculator_url), _price_table_page(calculator_url)]
+    for service in SERVICE_KEYS:
+        kind = _input_kind(service)
+        values = {'monthly_expenses': EXPENSE_POSITIONS, 'employees': EMPLOYEE_BREAKPOINTS}.get(kind, (0,))
+        pages += [_service_page(service, value, calculator_url) for value in values]
+    return pages
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+def _layout(title: str, depth: int, body: str, quote_url: str) -> str:
+    root = '../' * depth
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - Scout Financial</title>
+{APP_CSS}
+<style>
+    body {{ margin: 0; background: #f8fafc; }}
+    .page {{ max-width: 1100px; margin: 0 auto; padding: 2rem 1rem; }}
+    .tier-row {{ display: flex; gap: 1rem; flex-wrap: wrap; }}
+    .tier-row > div {{ flex: 1 1 280px; }}
+    .cta {{ display: inline-block; margin: 1.5rem 0; padding: 0.8rem 1.6rem; border-radius: 10px;
+            background: #1e3a5f; color: white; font-weight: 700; text-decoration: none; }}
+    .options a {{ display: inline-block; margin: 0 0.4rem 0.4rem 0; color: #1e3a5f; }}
+    .options a.current {{ font-weight: 800; text-decoration: none; }}
+    table.prices {{ border-collapse: collapse; width: 100%; }}
+    table.prices th, table.prices td {{ padding: 0.4rem 0.6rem; border-bottom: 1px solid #e2e8f0; text-align: left; }}
+</style>
+</head>
+<body class="stApp">
+<div class="page">
+<div class="main-header">
+    <div>
+        <h1><a href="{root}index.html" style="color: white; text-decoration: none;">Scout Financial</a></h1>
+        <p>Pricing</p>
+    </div>
+</div>
+{body}
+<a class="cta" href="{quote_url}">Start your custom quote →</a>
+<p><a href="{root}price-table.html">Full price table</a></p>
+<div style="text-align: center; color: #64748b; font-size: 0.85rem; padding: 1rem 0;">
+    <p>© 2026 Scout Financial. All rights reserved.</p>
+    <p>Final pricing confirmed after consultation</p>
+</div>
+</div>
+</body>
+</html>
+"""
+
+def _render_service(data: Dict) -> str:
+    kind = data['kind']
+    if kind == 'monthly_expenses':
+        selector = f"""
+<p><strong>Monthly Expenses: {format_currency(data['value'])}</strong></p>
+<input type="range" min="{data['options'][0]}" max="{data['options'][-1]}" step="5000" value="{data['value']}"
+       style="width: 100%;" onchange="location.href = 'expenses-' + this.value + '.html'">
+"""
+    elif kind == 'employees':
+        links = ''.join(
+            f'<a href="employees-{n}.html" class="{"current" if n == data["value"] else ""}">{n}</a>'
+            for n in data['options']
+        )
+        selector = f'<p><strong>Employees:</strong></p><div class="options">{links}</div>'
+    else:
+        selector = ''
+
+    cards = ''.join(f'<div>{tier_card_html(tier["tier"], tier, tier["price"])}</div>' for tier in data['tiers'])
+    body = f"""
+<h2>{data['icon']} {data['name']}</h2>
+<p style="color: #64748b;">{data['description']}</p>
+{selector}
+<div class="tier-row">{cards}</div>
+"""
+    return _layout(data['name'], 1, body, data['quote_url'])
+
+def _render_price_table(data: Dict) -> str:
+    rows = ''.join(
+        f"<tr><td>{row['service']}</td><td>{row['label']}</td>"
+        + ''.join(f"<td>{format_currency(price)}/wk</td>" for price in row['prices'])
+        + "</tr>"
+        for row in data['rows']
+    )
+    body = f"""
+<h2>Weekly Prices</h2>
+<table class="prices">
+<tr><th>Service</th><th></th><th>Tier 1</th><th>Tier 2</th><th>Tier 3</th></tr>
+{rows}
+</table>
+<p style="color: #64748b; font-size: 0.85rem;">Before bundle, volume and payment-term discounts.</p>
+"""
+    return _layout('Price Table', 0, body, data['quote_url'])
+
+def _render_index(data: Dict) -> str:
+    cards = ''.join(f"""
+<a href="{service['path']}" style="text-decoration: none; color: inherit; flex: 1 1 300px;">
+    <div class="service-card">
+        <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 0.5rem;">
+            <span style="font-size: 2rem;">{service['icon']}</span>
+            <h3 style="margin: 0; font-size: 1.1rem;">{service['name']}</h3>
+        </div>
+        <p style="color: #64748b; font-size: 0.85rem; margin: 0;">{service['description']}</p>
+    </div>
+</a>""" for service in data['services'])
+    body = f"""
+<h2>Our services</h2>
+<p>Bundle more to save more!</p>
+<div class="tier-row">{cards}</div>
+"""
+    return _layout('Pricing', 0, body, data['quote_url'])
+
+# ============================================================================
+# INCREMENTAL BUILD
+# ============================================================================
+def _fingerprint(html: str) -> str:
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+def build_site(output_dir: str, calculator_url: str) -> Dict[str, int]:
+    """Write changed pages, drop stale ones and update the manifest."""
+    manifest_path = os.path.join(output_dir, 'manifest.json')
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        manifest = {}
+
+    stats = {'written': 0, 'unchanged': 0, 'removed': 0}
+    new_manifest = {}
+    for page in build_pages(calculator_url):
+        # Fingerprint the rendered page so data, template and theme changes
+        # all count; rendering every page is cheap, writing them is not
+        html = page.render(page.data)
+        fingerprint = _fingerprint(html)
+        new_manifest[page.path] = fingerprint
+        target = os.path.join(output_dir, page.path)
+        if manifest.get(page.path) == fingerprint and os.path.exists(target):
+            stats['unchanged'] += 1
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(html)
+        stats['written'] += 1
+
+    for path in set(manifest) - set(new_manifest):
+        try:
+            os.remove(os.path.join(output_dir, path))
+            stats['removed'] += 1
+        except FileNotFoundError:
+            pass
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(new_manifest, f, indent=1, sort_keys=True)
+    return stats
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Pre-render the static pricing pages.")
+    parser.add_argument('output_dir')
+    parser.add_argument('--calculator-url', default=os.environ.get('SCOUT_CALCULATOR_URL', '/'),
+                        help="URL of the live Streamlit calculator")
+    args = parser.parse_args()
+    print(build_site(args.output_dir, args.calculator_url))
@@ -0,0 +1,242 @@
+"""
+Scout Financial - Theme
+Stylesheet and shared HTML fragments used by the Streamlit calculator and the
+static pricing pages.
+"""
+
+from typing import Dict
+
+from pricing import format_currency
+
+# ============================================================================
+# CUSTOM CSS STYLING
+# ============================================================================
+APP_CSS = """
+<style>
+    /* Import Google Font */
+    @import url('https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@400;500;600;700;800&display=swap');
+    
+    /* Global Styles */
+    .stApp {
+        font-family: 'Plus Jakarta Sans', sans-serif;
+    }
+    
+    /* Header Styling */
+    .main-header {
+        background: linear-gradient(135deg, #1e3a5f 0%, #0f2744 100%);
+        padding: 1.5rem 2rem;
+        border-radius: 16px;
+        margin-bottom: 2rem;
+        display: flex;
+        align-items: center;
+        gap: 1rem;
+    }
+    
+    .main-header h1 {
+        color: white;
+        margin: 0;
+        font-size: 1.8rem;
+        font-weight: 700;
+    }
+    
+    .main-header p {
+        color: #93c5fd;
+        margin: 0;
+        font-size: 0.9rem;
+    }
+    
+    /* Card Styling */
+    .service-card {
+        background: white;
+        border: 2px solid #e2e8f0;
+        border-radius: 16px;
+        padding: 1.5rem;
+        margin-bottom: 1rem;
+        transition: all 0.2s ease;
+    }
+    
+    .service-card:hover {
+        border-color: #3b82f6;
+        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.15);
+    }
+    
+    .service-card.selected {
+        border-color: #3b82f6;
+        background: #eff6ff;
+    }
+    
+    /* Tier Card Styling */
+    .tier-card {
+        background: white;
+        border: 2px solid #e2e8f0;
+        border-radius: 12px;
+        padding: 1.25rem;
+        height: 100%;
+    }
+    
+    .tier-card.tier-1 { border-top: 4px solid #64748b; }
+    .tier-card.tier-2 { border-top: 4px solid #3b82f6; }
+    .tier-card.tier-3 { border-top: 4px solid #6366f1; }
+    
+    .tier-badge {
+        display: inline-block;
+        padding: 0.25rem 0.75rem;
+        border-radius: 4px;
+        font-size: 0.75rem;
+        font-weight: 700;
+        color: white;
+        margin-bottom: 0.5rem;
+    }
+    
+    .tier-badge.tier-1 { background: #64748b; }
+    .tier-badge.tier-2 { background: #3b82f6; }
+    .tier-badge.tier-3 { background: #6366f1; }
+    
+    /* Quote Summary Box */
+    .quote-summary {
+        background: linear-gradient(135deg, #1e3a5f 0%, #0f2744 100%);
+        border-radius: 16px;
+        padding: 1.5rem;
+        color: white;
+    }
+    
+    .quote-summary h3 {
+        color: #93c5fd;
+        font-size: 0.9rem;
+        margin-bottom: 0.25rem;
+    }
+    
+    .quote-summary .total {
+        font-size: 2.5rem;
+        font-weight: 800;
+        margin: 0;
+    }
+    
+    /* Discount Badge */
+    .discount-badge {
+        background: #dcfce7;
+        border: 1px solid #86efac;
+        border-radius: 8px;
+        padding: 1rem;
+        margin: 1rem 0;
+    }
+    
+    .discount-badge h4 {
+        color: #166534;
+        margin: 0 0 0.5rem 0;
+        font-size: 0.9rem;
+    }
+    
+    .discount-badge p {
+        color: #15803d;
+        margin: 0;
+        font-size: 0.85rem;
+    }
+    
+    /* Progress Steps */
+    .step-indicator {
+        display: flex;
+        justify-content: center;
+        gap: 1rem;
+        margin-bottom: 2rem;
+    }
+    
+    .step {
+        width: 40px;
+        height: 40px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: 700;
+        font-size: 1rem;
+    }
+    
+    .step.active {
+        background: #3b82f6;
+        color: white;
+    }
+    
+    .step.completed {
+        background: #22c55e;
+        color: white;
+    }
+    
+    .step.inactive {
+        background: #e2e8f0;
+        color: #94a3b8;
+    }
+    
+    /* Feature List */
+    .feature-list {
+        list-style: none;
+        padding: 0;
+        margin: 0.5rem 0 0 0;
+    }
+    
+    .feature-list li {
+        font-size: 0.8rem;
+        color: #64748b;
+        padding: 0.2rem 0;
+    }
+    
+    .feature-list li::before {
+        content: "✓ ";
+        color: #22c55e;
+    }
+    
+    /* Hide Streamlit Elements */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    .stDeployButton {display: none;}
+    
+    /* Button Styling */
+    .stButton > button {
+        font-family: 'Plus Jakarta Sans', sans-serif;
+        font-weight: 600;
+        border-radius: 12px;
+        padding: 0.75rem 2rem;
+        transition: all 0.2s ease;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-1px);
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
+    }
+    
+    /* Slider Styling */
+    .stSlider {
+        padding-top: 0.25rem;
+    }
+    
+    .stSlider > div > div > div {
+        background: linear-gradient(90deg, #3b82f6 0%, #6366f1 100%);
+    }
+    
+    .stSlider > div > div > div > div {
+        background: #1e3a5f;
+        border: 2px solid white;
+        box-shadow: 0 2px 6px rgba(0, 0, 0, 0.2);
+    }
+</style>
+"""
+
+# ============================================================================
+# HTML FRAGMENTS
+# ============================================================================
+def tier_card_html(tier_num: int, tier_data: Dict, weekly_price: float) -> str:
+    """Tier card with name, weekly price, response time and top features."""
+    return f"""
+                    <div class="tier-card tier-{tier_num}">
+                        <span class="tier-badge tier-{tier_num}">TIER {tier_num}</span>
+                        <h4 style="margin: 0.5rem 0;">{tier_data['name']}</h4>
+                        <p style="font-size: 1.5rem; font-weight: 700; margin: 0.5rem 0;">
+                            {format_currency(weekly_price)}<span style="font-size: 0.9rem; color: #64748b;">/wk</span>
+                        </p>
+                        <p style="color: #64748b; font-size: 0.85rem;">{tier_data['description']}</p>
+                        <p style="font-size: 0.8rem;"><strong>⏱️ Response:</strong> {tier_data['response_time']}</p>
+                        <ul class="feature-list">
+                            {''.join([f'<li>{f}</li>' for f in tier_data['features'][:4]])}
+                        </ul>
+                    </div>
+                    """